@@ -10,6 +10,7 @@ Endpoints:
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import StreamingResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
 from starlette.middleware.base import BaseHTTPMiddleware
 from pydantic import BaseModel
 from typing import List, Dict, Optional, Any
@@ -101,7 +102,9 @@ from core.bridge import (
     run_new_engine_chat,
 )
 from core.intent_detector import detect_intent, ParsedIntent
+from core.llm_http import get_ollama_session, ollama_timeout
 from core.llm_intent import llm_extract_intent
+from core.parsing.chat_ingredients import prepare_chat_ingredients
 from core.response_composer import (
     compose_greeting as template_greeting,
     compose_profile_update as template_profile_update,
@@ -115,8 +118,8 @@ from core.response_composer import (
 )
 from core.llm_response import (
     llm_compose_greeting,
-    llm_compose_general,
     llm_compose_verdict_explanation,
+    llm_stream_general,
 )
 from core.stream_tags import PROFILE_REQUIRED_TAG, PROFILE_UPDATE_TAG, INGREDIENT_AUDIT_TAG
 from core.anon_session import sign_anon_token, verify_anon_token
@@ -129,12 +132,18 @@ from core.request_history import (
 
 @asynccontextmanager
 async def _app_lifespan(_app: FastAPI):
-    """Pre-load the Ollama model so the first user request is fast."""
+    """Pre-load the Ollama model and IKE-2 lookup tables so the first user request is fast."""
+    try:
+        from core.knowledge.ike2.resolver import warm_up as _warm_resolver
+        _warm_resolver()
+        logger.info("WARMUP IKE-2 resolver tables loaded")
+    except Exception as exc:
+        logger.warning("WARMUP IKE-2 resolver failed (non-fatal): %s", exc)
     if llm_enabled():
         def _ping():
             try:
-                import requests as _req
-                _req.post(
+                # Shared pool: the first chat reuses the connection opened here.
+                get_ollama_session().post(
                     get_ollama_url(),
                     json={
                         "model": get_ollama_model(),
@@ -142,7 +151,7 @@ async def _app_lifespan(_app: FastAPI):
                         "stream": False,
                         "options": {"num_predict": 1},
                     },
-                    timeout=60,
+                    timeout=ollama_timeout(60),
                 )
                 logger.info("WARMUP Ollama model loaded successfully")
             except Exception as exc:
@@ -266,7 +275,22 @@ class ProfileBody(BaseModel):
 # --- Helper Functions ---
 
 def _profile_json(profile: UserProfile) -> str:
-    return f"\n\n{PROFILE_UPDATE_TAG}{json.dumps(profile.to_dict())}{PROFILE_UPDATE_TAG}"
+    return _profile_tail(profile.to_dict())
+
+
+def _profile_tail(profile_state: Dict[str, Any]) -> str:
+    return f"\n\n{PROFILE_UPDATE_TAG}{json.dumps(profile_state)}{PROFILE_UPDATE_TAG}"
+
+
+async def _stream_general_reply(query: str, profile: UserProfile, fallback: str):
+    """Forward Ollama tokens for a general reply as they decode (first token in ~100ms
+    instead of waiting for the full generation); yield ``fallback`` if the LLM produced nothing."""
+    produced = False
+    async for piece in iterate_in_threadpool(llm_stream_general(query, profile)):
+        produced = True
+        yield piece
+    if not produced:
+        yield fallback
 
 
 def _parse_update_command(query: str):
@@ -299,9 +323,11 @@ def _apply_profile_updates(profile: UserProfile, updates: dict) -> dict:
             existing = []
         else:
             existing = list(profile.allergens or [])
+            seen = {e.lower() for e in existing}
             for a in (new_allergens or []):
-                if a and a.lower() not in [e.lower() for e in existing]:
+                if a and a.lower() not in seen:
                     existing.append(a)
+                    seen.add(a.lower())
         profile.update_merge(allergens=existing)
         updated_fields["allergens"] = updates["allergens"]
     if "remove_allergens" in updates:
@@ -312,9 +338,11 @@ def _apply_profile_updates(profile: UserProfile, updates: dict) -> dict:
         updated_fields["remove_allergens"] = updates["remove_allergens"]
     if "lifestyle" in updates:
         existing_ls = list(profile.lifestyle or [])
+        seen_ls = {e.lower() for e in existing_ls}
         for lf in updates["lifestyle"]:
-            if lf.lower() not in [e.lower() for e in existing_ls]:
+            if lf.lower() not in seen_ls:
                 existing_ls.append(lf)
+                seen_ls.add(lf.lower())
         profile.update_merge(lifestyle=existing_ls)
         updated_fields["lifestyle"] = updates["lifestyle"]
     return updated_fields
@@ -511,6 +539,9 @@ async def chat_grocery(request: Request, body: ChatRequest):
             # Identity: stable per response (matches request_history user_id)
             user_id = stream_user_id
             profile = get_or_create_profile(user_id)
+            # save_profile rewrites the whole profile store; skip it when a
+            # restated preference ("I'm vegan" again) leaves the profile as loaded.
+            loaded_profile_state = profile.to_dict()
 
             # 1) /update slash-command
             field_name, values = _parse_update_command(query)
@@ -549,9 +580,10 @@ async def chat_grocery(request: Request, body: ChatRequest):
                 parsed.intent, redact_pii(parsed.profile_updates), redact_pii(parsed.ingredients),
             )
 
-            # LLM fallback for ambiguous queries
+            # LLM fallback for ambiguous queries. Ollama calls are blocking HTTP, so
+            # every llm_* call below runs in the threadpool to keep the event loop free.
             if parsed.intent == "GENERAL_QUESTION" and not parsed.has_ingredients and not parsed.has_profile_update:
-                llm_data = llm_extract_intent(query)
+                llm_data = await run_in_threadpool(llm_extract_intent, query)
                 if llm_data:
                     logger.info("INTENT_DETECT_LLM_FALLBACK intent=%s", llm_data["intent"])
                     llm_profile_updates = {}
@@ -571,7 +603,7 @@ async def chat_grocery(request: Request, body: ChatRequest):
 
             # 3) Handle GREETING
             if parsed.intent == "GREETING":
-                msg = llm_compose_greeting(profile)
+                msg = await run_in_threadpool(llm_compose_greeting, profile)
                 yield msg or template_greeting(profile)
                 yield _profile_json(profile)
                 return
@@ -581,32 +613,35 @@ async def chat_grocery(request: Request, body: ChatRequest):
             updated_fields = {}
             if parsed.has_profile_update:
                 updated_fields = _apply_profile_updates(profile, parsed.profile_updates)
-                if updated_fields:
+            # The profile is final from here on: build its dict and the closing
+            # PROFILE_UPDATE chunk once, and reuse them on every exit below.
+            profile_state = profile.to_dict()
+            profile_tail = _profile_tail(profile_state)
+            if updated_fields:
+                if profile_state != loaded_profile_state:
                     save_profile(profile)
-                    profile_was_updated = True
-                    logger.info(
-                        "PROFILE_UPDATE_NL user_id=%s updated_fields=%s",
-                        redact_pii(user_id), list(updated_fields.keys()),
-                    )
+                profile_was_updated = True
+                logger.info(
+                    "PROFILE_UPDATE_NL user_id=%s updated_fields=%s",
+                    redact_pii(user_id), list(updated_fields.keys()),
+                )
 
             # 5) Profile-only update (no ingredients)
             if parsed.intent == "PROFILE_UPDATE" and not parsed.has_ingredients:
                 yield template_profile_update(profile, updated_fields, has_ingredients=False)
-                yield _profile_json(profile)
+                yield profile_tail
                 return
 
             # 6) General question (no ingredients)
             if parsed.intent == "GENERAL_QUESTION" and not parsed.has_ingredients:
                 if profile.is_empty():
                     yield f"{PROFILE_REQUIRED_TAG}\n\n"
-                msg = llm_compose_general(query, profile)
-                yield msg or template_general()
-                yield _profile_json(profile)
+                async for piece in _stream_general_reply(query, profile, template_general()):
+                    yield piece
+                yield profile_tail
                 return
 
             # 7) Extract ingredients (label decomposer for pasted labels)
-            from core.parsing.chat_ingredients import prepare_chat_ingredients
-
             prepared = prepare_chat_ingredients(query, parsed)
             ingredients = parsed.ingredients
             eval_ingredients = prepared.eval_names
@@ -614,15 +649,17 @@ async def chat_grocery(request: Request, body: ChatRequest):
 
             if profile.is_empty() and not eval_ingredients:
                 yield f"{PROFILE_REQUIRED_TAG}\n\n"
-                msg = llm_compose_general(query, profile)
-                yield msg or "Please set up your dietary profile first so I can give you personalized advice."
-                yield _profile_json(profile)
+                async for piece in _stream_general_reply(
+                    query, profile, "Please set up your dietary profile first so I can give you personalized advice."
+                ):
+                    yield piece
+                yield profile_tail
                 return
 
             if not eval_ingredients:
-                msg = llm_compose_general(query, profile)
-                yield msg or template_no_ingredients()
-                yield _profile_json(profile)
+                async for piece in _stream_general_reply(query, profile, template_no_ingredients()):
+                    yield piece
+                yield profile_tail
                 return
 
             # 8) Prepared atoms (decomposer or compound expansion)
@@ -631,16 +668,14 @@ async def chat_grocery(request: Request, body: ChatRequest):
 
             # 9) Run DETERMINISTIC compliance engine
             restriction_ids = user_profile_model_to_restriction_ids(profile)
-            profile_context = {
-                "dietary_preference": profile.dietary_preference,
-                "allergens": profile.allergens,
-                "lifestyle": profile.lifestyle,
-            }
+            profile_context = profile.to_context_dict()
             logger.info(
                 "COMPLIANCE_RUN eval_ingredients=%s compounds=%s restriction_ids=%s",
                 redact_pii(eval_ingredients), redact_pii(compound_map), restriction_ids,
             )
-            verdict = run_new_engine_chat(
+            # Compliance may reach Tier-3/external lookups; keep it off the event loop.
+            verdict = await run_in_threadpool(
+                run_new_engine_chat,
                 eval_ingredients,
                 user_profile=profile,
                 restriction_ids=restriction_ids,
@@ -687,6 +722,10 @@ async def chat_grocery(request: Request, body: ChatRequest):
                 str(u).strip().title() for u in (verdict.uncertain_ingredients or [])
             ]
             safe_count = count_safe_audit_ingredients(eval_ingredients, verdict)
+            # 11) Emit profile first when updated so frontend header shows current diet
+            # before audit -- and before the LLM explanation, which can take seconds.
+            if profile_was_updated:
+                yield profile_tail
             if llm_enabled() and (
                 verdict.status != VerdictStatus.SAFE
                 or (
@@ -694,7 +733,8 @@ async def chat_grocery(request: Request, body: ChatRequest):
                     and not (verdict.uncertain_ingredients or [])
                 )
             ):
-                llm_expl = llm_compose_verdict_explanation(
+                llm_expl = await run_in_threadpool(
+                    llm_compose_verdict_explanation,
                     verdict=verdict,
                     profile=profile,
                     avoid_substances=avoid_substances,
@@ -705,9 +745,6 @@ async def chat_grocery(request: Request, body: ChatRequest):
                 if llm_expl:
                     explanation_text = llm_expl
                     explanation_source = "llm"
-            # 11) Emit profile first when updated so frontend header shows current diet before audit
-            if profile_was_updated:
-                yield _profile_json(profile)
             # 12) Emit structured INGREDIENT_AUDIT JSON for premium frontend cards
             audit_payload = build_ingredient_audit_payload(
                 verdict=verdict,
@@ -721,7 +758,7 @@ async def chat_grocery(request: Request, body: ChatRequest):
             logger.info("INGREDIENT_AUDIT_EMITTED groups=%s", [g.get("status") for g in audit_payload.get("groups", [])])
             yield audit_block
             if not profile_was_updated:
-                yield _profile_json(profile)
+                yield profile_tail
 
         async def stream_with_history():
             chunks = []
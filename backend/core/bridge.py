@@ -4,7 +4,11 @@ Bridge: map profile diet names to restriction_ids; run compliance engine for cha
 import hashlib
 import logging
 import sys
+import threading
+import time
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from types import SimpleNamespace
 from typing import Dict, List, Any, Optional, Set, Tuple, TYPE_CHECKING
 
@@ -12,6 +16,7 @@ if TYPE_CHECKING:
     from core.models.user_profile import UserProfile
 
 from core.knowledge.ike2 import input_layer as ike2_input_layer
+from core.knowledge.ike2 import resolution_cache as ike2_resolution_cache
 from core.knowledge.ike2 import resolver as ike2_resolver
 from core.knowledge.ike2 import rules as ike2_rules
 from core.knowledge.ike2 import compliance as ike2_compliance
@@ -150,6 +155,19 @@ def profile_to_restriction_ids(user_profile: Optional[Dict[str, Any]]) -> List[s
 
 def user_profile_model_to_restriction_ids(profile: "UserProfile") -> List[str]:
     """Build restriction_ids from UserProfile model."""
+    return list(_restriction_ids_for(
+        profile.dietary_preference or "no rules",
+        tuple(str(a) for a in profile.allergens or []),
+        tuple(str(v) for v in profile.lifestyle or []),
+    ))
+
+
+# Every chat turn re-derives ids from the same few profiles, and the mapping
+# tables are static; keyed on the fields in order so id order is unchanged.
+@lru_cache(maxsize=256)
+def _restriction_ids_for(
+    dietary_preference: str, allergens: Tuple[str, ...], lifestyle: Tuple[str, ...]
+) -> Tuple[str, ...]:
     ids: List[str] = []
     seen: Set[str] = set()
 
@@ -159,7 +177,7 @@ def user_profile_model_to_restriction_ids(profile: "UserProfile") -> List[str]:
             ids.append(rid)
 
     # Primary dietary preference
-    pref = (profile.dietary_preference or "no rules").lower().strip()
+    pref = dietary_preference.lower().strip()
     if pref and pref != "no rules":
         rid = DIETARY_PREFERENCE_TO_RESTRICTION_ID.get(pref)
         if not rid:
@@ -169,20 +187,20 @@ def user_profile_model_to_restriction_ids(profile: "UserProfile") -> List[str]:
             _add(rid)
 
     # Allergens
-    for a in profile.allergens or []:
-        key = _normalize_key(str(a))
+    for a in allergens:
+        key = _normalize_key(a)
         rid = ALLERGEN_TO_RESTRICTION_ID.get(key) or LIFESTYLE_TO_RESTRICTION_ID.get(key)
         if rid:
             _add(rid)
 
     # Lifestyle
-    for v in profile.lifestyle or []:
-        key = _normalize_key(str(v))
+    for v in lifestyle:
+        key = _normalize_key(v)
         rid = LIFESTYLE_TO_RESTRICTION_ID.get(key) or DIETARY_PREFERENCE_TO_RESTRICTION_ID.get(key)
         if rid:
             _add(rid)
 
-    return ids
+    return tuple(ids)
 
 
 # ---------------------------------------------------------------------------
@@ -417,6 +435,76 @@ def _record_display(
         display_map[_UNRESOLVED_POS_KEY.format(idx)] = raw_display
 
 
+# Chat users re-check the same label under the same profile (follow-ups,
+# retries, pasting the label again), and every IKE-2 run re-fetches the rule
+# table. Fully resolved results are kept for a short while so those repeats
+# skip the rules round-trip and the per-atom resolve. Entries are keyed on the
+# restriction set, so a profile change never reads another profile's result;
+# the TTL bounds how long a DB rule edit can go unseen.
+IKE2_RESULT_CACHE_TTL_SEC = 300
+IKE2_RESULT_CACHE_MAX_ENTRIES = 1024
+
+_ike2_result_cache: "OrderedDict[tuple, Tuple[float, Any, List[Any], Dict[str, str]]]" = OrderedDict()
+_ike2_result_cache_lock = threading.Lock()
+_ike2_result_cache_generation = ike2_resolution_cache.generation()
+
+
+def clear_ike2_result_cache() -> None:
+    """Drop every cached IKE-2 result (tests, rule reloads)."""
+    with _ike2_result_cache_lock:
+        _ike2_result_cache.clear()
+
+
+def _ike2_result_cache_key(
+    ingredients: Optional[List[str]],
+    restriction_ids: Optional[List[str]],
+    prepared_decomposed: Optional[List[Any]],
+    region: Optional[str],
+) -> tuple:
+    if prepared_decomposed is not None:
+        atoms: tuple = (
+            "atoms",
+            tuple((a.name, bool(a.trace), bool(a.may_contain)) for a in prepared_decomposed),
+        )
+    else:
+        atoms = ("raw", tuple(ingredients or []))
+    return atoms, tuple(sorted(set(restriction_ids or []))), region
+
+
+def _ike2_result_cache_get(key: tuple) -> Optional[Tuple[Any, List[Any], Dict[str, str]]]:
+    global _ike2_result_cache_generation
+    now = time.monotonic()
+    with _ike2_result_cache_lock:
+        # A cleared resolution cache means entries may have been built from
+        # resolutions that no longer hold.
+        generation = ike2_resolution_cache.generation()
+        if generation != _ike2_result_cache_generation:
+            _ike2_result_cache.clear()
+            _ike2_result_cache_generation = generation
+            return None
+        entry = _ike2_result_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, result, inputs, display_map = entry
+        if now - stored_at > IKE2_RESULT_CACHE_TTL_SEC:
+            del _ike2_result_cache[key]
+            return None
+        _ike2_result_cache.move_to_end(key)
+    # The result is only read downstream; the containers are copied so a
+    # caller appending to them cannot leak into the next hit.
+    return result, list(inputs), dict(display_map)
+
+
+def _ike2_result_cache_put(
+    key: tuple, result: Any, inputs: List[Any], display_map: Dict[str, str]
+) -> None:
+    with _ike2_result_cache_lock:
+        _ike2_result_cache[key] = (time.monotonic(), result, list(inputs), dict(display_map))
+        _ike2_result_cache.move_to_end(key)
+        while len(_ike2_result_cache) > IKE2_RESULT_CACHE_MAX_ENTRIES:
+            _ike2_result_cache.popitem(last=False)
+
+
 def _run_ike2_compliance(
     ingredients: List[str],
     restriction_ids: Optional[List[str]],
@@ -430,14 +518,25 @@ def _run_ike2_compliance(
     Same pipeline as ``core.knowledge.ike2.shadow.runner.ike2_external_verdict``,
     kept separate because that module returns only the external status string
     while the chat path needs the full result to build a ``ComplianceVerdict``.
+
+    Results where every atom resolved are served from a short-lived in-process
+    cache on repeat; anything with an unresolved atom is recomputed so a later
+    Tier-3 hit is picked up immediately.
     """
+    cache_key = _ike2_result_cache_key(ingredients, restriction_ids, prepared_decomposed, region)
+    cached = _ike2_result_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
     profile = _profile_from_restriction_ids(restriction_ids)
     active_rules = ike2_rules.load_rules()
     inputs = []
     display_map: Dict[str, str] = {}
+    all_resolved = True
     if prepared_decomposed is not None:
         for idx, atom in enumerate(prepared_decomposed):
             resolved = ike2_resolver.resolve(atom.name, region)
+            all_resolved = all_resolved and resolved.status == "resolved"
             ci = to_compliance_input(
                 resolved,
                 trace=atom.trace,
@@ -453,6 +552,7 @@ def _run_ike2_compliance(
         for raw in ingredients or []:
             for atom in ike2_input_layer.parse_atoms(raw):
                 resolved = ike2_resolver.resolve(atom.name, region)
+                all_resolved = all_resolved and resolved.status == "resolved"
                 ci = to_compliance_input(
                     resolved,
                     trace=atom.trace,
@@ -463,6 +563,8 @@ def _run_ike2_compliance(
                 _record_display(display_map, idx, ci.canonical_name, raw)
                 idx += 1
     result = ike2_compliance.evaluate(inputs, profile, active_rules)
+    if all_resolved and inputs:
+        _ike2_result_cache_put(cache_key, result, inputs, display_map)
     return result, inputs, display_map
 
 
@@ -4,6 +4,7 @@ All resolution relative to the backend directory.
 """
 import os
 import logging
+import tempfile
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -57,6 +58,23 @@ def get_profile_options_path() -> Path:
     """Single source of truth for diet/allergen/lifestyle options (served to frontend via GET /config)."""
     return _REPO_ROOT / "data" / "profile_options.json"
 
+def write_text_atomic(path: Path, text: str) -> None:
+    """Replace path with text via a temp file in the same directory, so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        # mkstemp creates 0600; keep the permissions the file had (or a plain 0644).
+        os.chmod(tmp, path.stat().st_mode & 0o777 if path.exists() else 0o644)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
 # --- API constants (single source; frontend fetches via GET /config) ---
 MAX_CHAT_MESSAGE_LENGTH = int(os.environ.get("MAX_CHAT_MESSAGE_LENGTH", "8192"))
 
@@ -7,7 +7,7 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from core.config import get_dynamic_ontology_path
+from core.config import get_dynamic_ontology_path, write_text_atomic
 from core.ontology.ingredient_schema import Ingredient
 
 logger = logging.getLogger(__name__)
@@ -42,16 +42,14 @@ class DynamicOntology:
             self._ingredients = []
 
     def _save(self) -> None:
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self._path, "w", encoding="utf-8") as f:
-            json.dump(
-                {
-                    "ontology_version": self._version,
-                    "ingredients": self._ingredients,
-                },
-                f,
-                indent=2,
-            )
+        text = json.dumps(
+            {
+                "ontology_version": self._version,
+                "ingredients": self._ingredients,
+            },
+            indent=2,
+        )
+        write_text_atomic(self._path, text)
 
     def append(
         self,
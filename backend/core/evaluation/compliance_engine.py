@@ -67,6 +67,8 @@ class ComplianceEngine:
 
         def _lookup_user_display(atom_raw: str, ing: Ingredient) -> str:
             """Map evaluated atom back to what the user typed (E-number, label text, etc.)."""
+            if not display_map:
+                return atom_raw
             candidates = [
                 substance_key(atom_raw),
                 substance_key(ing.canonical_name),
@@ -111,7 +113,9 @@ class ComplianceEngine:
         resolution_levels: List[str] = []
 
         max_workers = min(8, max(1, len(items)))
-        if len(items) <= 1:
+        # Offline resolution is in-memory dict work: a thread pool only pays off
+        # when unknowns may go out to the external APIs.
+        if len(items) <= 1 or not use_api_fallback:
             results_ordered = [resolve_one(it) for it in items]
         else:
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
@@ -197,13 +201,14 @@ class ComplianceEngine:
                 (restriction_ids or [])[:10],
             )
 
-        rest_ids = self._restrictions.list_ids()
         if restriction_ids is not None:
             rest_ids = [rid for rid in restriction_ids if self._restrictions.get(rid) is not None]
+        else:
+            rest_ids = self._restrictions.list_ids()
         if region_scope:
             rest_ids = [
                 rid for rid in rest_ids
-                if self._restrictions.get(rid) and region_scope in (self._restrictions.get(rid).region_scope or [])
+                if region_scope in (self._restrictions.get(rid).region_scope or [])
             ]
 
         triggered_restrictions: List[str] = []
@@ -214,21 +219,29 @@ class ComplianceEngine:
         triggered_ingredients_from_minor: set = set()
         warning_count = 0
 
+        # One sweep per restriction; substance keys are computed once per
+        # ingredient even when several restrictions fail on it.
+        substance_by_idx: Dict[int, str] = {}
+        n_raw = len(resolved_raw)
+        n_trace = len(resolved_is_trace)
         for restriction_id in rest_ids:
             rest = self._restrictions.get(restriction_id)
             if not rest:
                 continue
-            for idx, ing in enumerate(resolved):
-                result, reason = self._restrictions.evaluate(ing, rest)
+            for idx, (result, _reason) in enumerate(self._restrictions.evaluate_many(resolved, rest)):
                 if result == "FAIL":
                     triggered_restrictions.append(restriction_id)
-                    substance = substance_key(ing.canonical_name) or ing.canonical_name
+                    substance = substance_by_idx.get(idx)
+                    if substance is None:
+                        ing = resolved[idx]
+                        substance = substance_key(ing.canonical_name) or ing.canonical_name
+                        substance_by_idx[idx] = substance
                     if substance not in seen_substances:
                         seen_substances.add(substance)
                         triggered_ingredients.append(substance)
-                    if substance not in triggered_ingredient_to_input and idx < len(resolved_raw):
+                    if substance not in triggered_ingredient_to_input and idx < n_raw:
                         triggered_ingredient_to_input[substance] = resolved_raw[idx]
-                    if idx < len(resolved_is_trace) and resolved_is_trace[idx]:
+                    if idx < n_trace and resolved_is_trace[idx]:
                         triggered_restrictions_from_minor.add(restriction_id)
                         triggered_ingredients_from_minor.add(substance)
                 elif result == "WARN":
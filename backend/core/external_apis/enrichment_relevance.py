@@ -49,20 +49,30 @@ def _word_in(text: str, word: str) -> bool:
     return bool(re.search(rf"\b{re.escape(word)}(?:e?s)?\b", text, re.IGNORECASE))
 
 
+def _any_word_re(words: tuple[str, ...]) -> re.Pattern[str]:
+    """One pattern that matches when ``_word_in`` would match any of ``words``."""
+    alternatives = "|".join(re.escape(w) for w in words)
+    return re.compile(rf"\b(?:{alternatives})(?:e?s)?\b", re.IGNORECASE)
+
+
+# Keyword lists compiled once, so each check is a single scan of the text
+# instead of one regex search (or substring test) per keyword.
+_PLANT_OVERRIDE_RE = re.compile("|".join(re.escape(p) for p in _PLANT_OVERRIDE_PATTERNS))
+_SPECIES_RES: dict[str, re.Pattern[str]] = {
+    group: _any_word_re(terms) for group, terms in _SPECIES_TERMS.items()
+}
+_ANIMAL_DAIRY_RE = _any_word_re(_ANIMAL_DAIRY_KEYWORDS)
+
+
 def _is_plant_override(text: str) -> bool:
-    t = (text or "").lower()
-    return any(p in t for p in _PLANT_OVERRIDE_PATTERNS)
+    return _PLANT_OVERRIDE_RE.search((text or "").lower()) is not None
 
 
 def species_groups_in_text(text: str) -> frozenset[str]:
     """Return meat-species groups mentioned in label/API text."""
     if not text:
         return frozenset()
-    groups: set[str] = set()
-    for group, terms in _SPECIES_TERMS.items():
-        if any(_word_in(text, term) for term in terms):
-            groups.add(group)
-    return frozenset(groups)
+    return frozenset(group for group, pattern in _SPECIES_RES.items() if pattern.search(text))
 
 
 def enrichment_species_mismatch(query: str, candidate: str) -> bool:
@@ -82,8 +92,7 @@ def enrichment_plant_animal_mismatch(query: str, candidate: str) -> bool:
         return False
     if species_groups_in_text(candidate):
         return True
-    c = (candidate or "").lower()
-    return any(_word_in(c, kw) for kw in _ANIMAL_DAIRY_KEYWORDS)
+    return _ANIMAL_DAIRY_RE.search((candidate or "").lower()) is not None
 
 
 def is_enrichment_relevant(query: str, candidate: str) -> bool:
@@ -5,11 +5,10 @@ Layer 2 (scientific) sources used when food APIs miss (e.g. E-numbers, chemical
 import hashlib
 import logging
 import re
+import threading
 import time
 from typing import Optional
 
-import requests
-
 from core.ontology.ingredient_schema import Ingredient
 from core.external_apis.base import EnrichmentResult
 from core.external_apis.usda_fdc import fetch_usda_fdc
@@ -26,6 +25,7 @@ from core.config import (
     get_ollama_model,
     llm_enabled,
 )
+from core.llm_http import get_ollama_session, ollama_timeout
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +33,8 @@ logger = logging.getLogger(__name__)
 _api_cache: dict[str, tuple[EnrichmentResult, float]] = {}
 _CACHE_MAX_ENTRIES = 500
 _CACHE_TTL_SECONDS = 3600  # 1 hour
+# Enrichment batches fetch concurrently; guards every read, eviction, insert and clear.
+_cache_lock = threading.Lock()
 
 
 def _cache_key(normalized_query: str) -> str:
@@ -48,10 +50,10 @@ def _resolve_to_english_llm(query: str, timeout: int = 5) -> Optional[str]:
             f"What is the common English or scientific name for this food ingredient? "
             f"Reply with only the name, one line, no explanation. Ingredient: {query.strip()[:100]}"
         )
-        r = requests.post(
+        r = get_ollama_session().post(
             get_ollama_url(),
             json={"model": get_ollama_model(), "prompt": prompt, "stream": False},
-            timeout=timeout,
+            timeout=ollama_timeout(timeout),
         )
         r.raise_for_status()
         text = (r.json().get("response") or "").strip()
@@ -69,7 +71,7 @@ def _resolve_to_english_llm(query: str, timeout: int = 5) -> Optional[str]:
 
 
 def _evict_expired() -> None:
-    """Remove expired entries when cache is full."""
+    """Remove expired entries when cache is full. Caller holds _cache_lock."""
     if len(_api_cache) < _CACHE_MAX_ENTRIES:
         return
     now = time.time()
@@ -92,13 +94,15 @@ def fetch_ingredient_from_apis(
 
     # Use cache only for successful resolutions so unknowns always trigger external API search.
     # Never return cached "no result" — we want best/correct results by calling APIs when unknown.
-    if use_cache and key in _api_cache:
-        cached, ts = _api_cache[key]
-        if time.time() - ts < _CACHE_TTL_SECONDS and cached.ingredient is not None:
-            logger.debug("ENRICHMENT cache hit (success) key=%s", normalized_ingredient_key[:50])
-            return cached
-        if key in _api_cache:
-            del _api_cache[key]
+    if use_cache:
+        with _cache_lock:
+            entry = _api_cache.get(key)
+            if entry is not None:
+                cached, ts = entry
+                if time.time() - ts < _CACHE_TTL_SECONDS and cached.ingredient is not None:
+                    logger.debug("ENRICHMENT cache hit (success) key=%s", normalized_ingredient_key[:50])
+                    return cached
+                _api_cache.pop(key, None)
 
     best: Optional[EnrichmentResult] = None
     query = normalized_ingredient_key.replace("_", " ").strip()
@@ -216,9 +220,10 @@ def fetch_ingredient_from_apis(
     # Cache only successful results so next time we serve from cache; never cache "no result".
     # This way unknown ingredients always trigger external API search until we get a real resolution.
     if use_cache and best.ingredient is not None:
-        _evict_expired()
-        if len(_api_cache) < _CACHE_MAX_ENTRIES:
-            _api_cache[key] = (best, time.time())
+        with _cache_lock:
+            _evict_expired()
+            if len(_api_cache) < _CACHE_MAX_ENTRIES:
+                _api_cache[key] = (best, time.time())
 
     return best
 
@@ -234,5 +239,5 @@ def enrich_unknown_ingredient(
 
 def clear_enrichment_cache() -> None:
     """Clear in-memory API cache (e.g. for tests)."""
-    global _api_cache
-    _api_cache = {}
+    with _cache_lock:
+        _api_cache.clear()
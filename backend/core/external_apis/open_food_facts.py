@@ -39,11 +39,11 @@ _PLANT_OVERRIDE_PATTERNS = [
     "butternut", "buttercup squash", "butterbean", "butter bean",
     "butterscotch", "cream of tartar", "creamed corn", "cream soda",
 ]
+_PLANT_OVERRIDE_RE = re.compile("|".join(re.escape(p) for p in _PLANT_OVERRIDE_PATTERNS))
 
 
 def _is_plant_override(text: str) -> bool:
-    t = text.lower()
-    return any(p in t for p in _PLANT_OVERRIDE_PATTERNS)
+    return _PLANT_OVERRIDE_RE.search(text.lower()) is not None
 
 
 def _word_match(text: str, word: str) -> bool:
@@ -7,6 +7,7 @@ via Wikidata (resolve_to_english_label) and persist with set_learned_english().
 """
 import json
 import logging
+import threading
 from typing import List
 
 from core.config import get_regional_ingredient_names_path, get_learned_regional_mappings_path
@@ -34,6 +35,8 @@ _static_only_regional: dict[str, str] = {}
 _loaded_static = False
 _loaded_learned = False
 _learned: dict[str, str] = {}
+# Serializes read-modify-write of the learned mappings file across enrichment threads.
+_persist_lock = threading.Lock()
 
 
 def _normalize(s: str) -> str:
@@ -123,14 +126,15 @@ def set_learned_english(query: str, english_name: str) -> None:
     _regional_to_canonical[norm] = en
     path = get_learned_regional_mappings_path()
     try:
-        if path.exists():
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
-        else:
-            data = {"description": "Auto-learned regional → English from user searches and API results", "mappings": {}}
-        data.setdefault("mappings", {})[norm] = en
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with _persist_lock:
+            if path.exists():
+                with open(path, encoding="utf-8") as f:
+                    data = json.load(f)
+            else:
+                data = {"description": "Auto-learned regional → English from user searches and API results", "mappings": {}}
+            data.setdefault("mappings", {})[norm] = en
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
         logger.debug("Learned regional mapping: %s -> %s", norm[:50], en[:50])
     except Exception as e:
         logger.warning("Failed to persist learned regional mapping to %s: %s", path, e)
@@ -5,6 +5,7 @@ Search: GET https://api.nal.usda.gov/fdc/v1/foods/search?api_key=KEY&query=...
 """
 import logging
 import re
+from functools import lru_cache
 
 import requests
 
@@ -59,17 +60,42 @@ _PLANT_OVERRIDE_PATTERNS = [
     "butterscotch",  # flavoring, not dairy
     "cream of tartar", "creamed corn", "cream soda", "ice cream bean",
 ]
+_PLANT_OVERRIDE_RE = re.compile("|".join(re.escape(p) for p in _PLANT_OVERRIDE_PATTERNS))
 
 
 def _is_plant_override(text: str) -> bool:
     """Return True if the text matches a known plant-based item despite containing animal keywords."""
-    t = text.lower()
-    return any(p in t for p in _PLANT_OVERRIDE_PATTERNS)
+    return _PLANT_OVERRIDE_RE.search(text.lower()) is not None
+
+
+@lru_cache(maxsize=None)
+def _words_re(*words: str) -> "re.Pattern[str]":
+    """Word-boundary pattern with plural tolerance: 'onion' matches 'onion' and 'onions'."""
+    return re.compile(r"\b(?:" + "|".join(re.escape(w) for w in words) + r")(?:e?s)?\b")
 
 
 def _word_match(text: str, word: str) -> bool:
     """Word-boundary match with plural tolerance: 'onion' matches 'onion' and 'onions'."""
-    return bool(re.search(r'\b' + re.escape(word) + r'(?:e?s)?\b', text))
+    return _words_re(word).search(text) is not None
+
+
+# Keyword groups for _infer_flags_from_text, one alternation each: a single
+# search per flag instead of one regex per keyword (bulk transforms call this per row).
+_ANIMAL_KEYWORDS_RE = _words_re("meat", "beef", "pork", "chicken", "fish", "gelatin",
+                                "lard", "tallow", "animal", "whey", "casein", "rennet")
+_DAIRY_KEYWORDS_RE = _words_re("milk", "cheese", "whey", "cream", "butter", "dairy",
+                               "lactose", "casein", "ghee", "curd", "yogurt")
+_EGG_RE = _words_re("egg")
+_GLUTEN_RE = _words_re("wheat", "barley", "rye", "gluten")
+_SOY_RE = _words_re("soy", "soybean", "tofu", "tempeh")
+_PEANUT_RE = _words_re("peanut")
+_TREE_NUT_RE = _words_re("almond", "walnut", "cashew", "pecan", "hazelnut", "macadamia", "pistachio")
+_SESAME_RE = _words_re("sesame")
+_ALCOHOL_RE = _words_re("alcohol", "wine", "beer", "spirit", "rum", "vodka", "whiskey")
+_ONION_RE = _words_re("onion")
+_GARLIC_RE = _words_re("garlic")
+_ROOT_VEGETABLE_RE = _words_re("potato", "carrot", "beet", "radish", "turnip", "yam",
+                               "onion", "garlic", "shallot", "leek")
 
 
 def _infer_flags_from_category(category: str) -> dict:
@@ -107,9 +133,7 @@ def _infer_flags_from_text(text: str, category: str = "") -> dict:
         plant_origin = True
     else:
         # Category ambiguous (e.g. "Snacks", "Meals"): use careful text inference
-        animal_keywords = ["meat", "beef", "pork", "chicken", "fish", "gelatin",
-                           "lard", "tallow", "animal", "whey", "casein", "rennet"]
-        animal_origin = not override and any(_word_match(t, w) for w in animal_keywords)
+        animal_origin = not override and _ANIMAL_KEYWORDS_RE.search(t) is not None
         plant_origin = not animal_origin
 
     # Dairy: only if category says so OR explicit dairy keywords (not overridden)
@@ -118,9 +142,7 @@ def _infer_flags_from_text(text: str, category: str = "") -> dict:
     elif override:
         dairy_source = False
     else:
-        dairy_keywords = ["milk", "cheese", "whey", "cream", "butter", "dairy",
-                          "lactose", "casein", "ghee", "curd", "yogurt"]
-        dairy_source = any(_word_match(t, w) for w in dairy_keywords) and not override
+        dairy_source = _DAIRY_KEYWORDS_RE.search(t) is not None and not override
 
     # Egg: only from category or explicit 'egg' keyword (excluding 'eggplant')
     if cat_flags["egg_source"]:
@@ -128,23 +150,23 @@ def _infer_flags_from_text(text: str, category: str = "") -> dict:
     elif override:
         egg_source = False
     else:
-        egg_source = _word_match(t, "egg") and "eggplant" not in t and "egg plant" not in t
+        egg_source = _EGG_RE.search(t) is not None and "eggplant" not in t and "egg plant" not in t
 
     return {
         "animal_origin": animal_origin,
         "plant_origin": plant_origin,
         "dairy_source": dairy_source,
         "egg_source": egg_source,
-        "gluten_source": any(_word_match(t, w) for w in ["wheat", "barley", "rye", "gluten"]),
-        "soy_source": _word_match(t, "soy") or _word_match(t, "soybean") or _word_match(t, "tofu") or _word_match(t, "tempeh"),
-        "nut_source": ("peanut" if _word_match(t, "peanut") else
-                       "tree_nut" if _word_match(t, "almond") or _word_match(t, "walnut") or _word_match(t, "cashew") or _word_match(t, "pecan") or _word_match(t, "hazelnut") or _word_match(t, "macadamia") or _word_match(t, "pistachio") else
+        "gluten_source": _GLUTEN_RE.search(t) is not None,
+        "soy_source": _SOY_RE.search(t) is not None,
+        "nut_source": ("peanut" if _PEANUT_RE.search(t) else
+                       "tree_nut" if _TREE_NUT_RE.search(t) else
                        None),
-        "sesame_source": _word_match(t, "sesame"),
-        "alcohol_content": 1.0 if any(_word_match(t, w) for w in ["alcohol", "wine", "beer", "spirit", "rum", "vodka", "whiskey"]) else None,
-        "onion_source": _word_match(t, "onion") and not override,
-        "garlic_source": _word_match(t, "garlic") and not override,
-        "root_vegetable": any(_word_match(t, w) for w in ["potato", "carrot", "beet", "radish", "turnip", "yam", "onion", "garlic", "shallot", "leek"]),
+        "sesame_source": _SESAME_RE.search(t) is not None,
+        "alcohol_content": 1.0 if _ALCOHOL_RE.search(t) else None,
+        "onion_source": _ONION_RE.search(t) is not None and not override,
+        "garlic_source": _GARLIC_RE.search(t) is not None and not override,
+        "root_vegetable": _ROOT_VEGETABLE_RE.search(t) is not None,
     }
 
 
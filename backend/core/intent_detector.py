@@ -14,8 +14,12 @@ Flow: Normalize input → map diet synonyms → extract entities → classify in
 import re
 import logging
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
 
+from core.parsing.label_normalize import _protect_and_phrases, _restore_and_phrases
+from core.parsing.label_text import fix_ocr_label_noise, select_ingredient_label_text
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -82,6 +86,16 @@ _DIET_PATTERN_KEYS = sorted(DIET_KEYWORDS.keys(), key=len, reverse=True)
 _DIET_REGEX = "|".join(re.escape(k) for k in _DIET_PATTERN_KEYS)
 
 
+def _compile_typo_fix(wrong: str) -> "re.Pattern[str]":
+    if len(wrong) <= 3 or wrong in {"i'm", "im"}:
+        return re.compile(rf"\b{re.escape(wrong)}\b", re.IGNORECASE)
+    return re.compile(re.escape(wrong), re.IGNORECASE)
+
+
+# Applied in NORMALIZATION order: a later fix may act on an earlier one's output.
+_TYPO_FIXES = [(_compile_typo_fix(wrong), right) for wrong, right in NORMALIZATION.items()]
+
+
 def normalize_query_for_typos(text: str) -> str:
     """Apply typo normalization so diet detection works on common misspellings.
 
@@ -91,11 +105,8 @@ def normalize_query_for_typos(text: str) -> str:
     if not text:
         return text
     t = text.lower().strip()
-    for wrong, right in NORMALIZATION.items():
-        if len(wrong) <= 3 or wrong in {"i'm", "im"}:
-            t = re.sub(rf"\b{re.escape(wrong)}\b", right, t, flags=re.IGNORECASE)
-        else:
-            t = re.sub(re.escape(wrong), right, t, flags=re.IGNORECASE)
+    for pattern, right in _TYPO_FIXES:
+        t = pattern.sub(right, t)
     return t
 
 
@@ -190,6 +201,27 @@ _LIFESTYLE_PATTERNS = [
     re.compile(r"\b(?:set|add|update)\s+(?:my\s+)?lifestyle\s+(?:to\s+)?(.+?)[\?\.\!]?\s*$", re.IGNORECASE),
 ]
 
+# Single-pass cue scans: each profile pattern family needs its cue somewhere in
+# the text, so one search decides whether the family's pattern loop can match at all.
+_DIET_CUE_RE = re.compile(_DIET_REGEX, re.IGNORECASE)
+_ALLERGY_CUE_RE = re.compile(r"allerg", re.IGNORECASE)
+_LIFESTYLE_CUE_RE = re.compile(
+    r"alcohol|onion|garlic|palm\s+oil|seed\s+oil|gmo|artificial\s+color|lifestyle",
+    re.IGNORECASE,
+)
+
+# Shared by the profile extractors below, which excise a matched clause and
+# then tidy what is left.
+_WHITESPACE_RE = re.compile(r"\s+")
+_LEADING_PUNCT_RE = re.compile(r"^\s*[,;.]+\s*")
+_ALLERGEN_LIST_SPLIT_RE = re.compile(r"\s*(?:,|and)\s*")
+_ALLERGEN_FILLER_WORDS = frozenset(
+    {"a", "an", "my", "the", "to", "of", "allergy", "allergies", "allergen", "allergens"}
+)
+_DOTTED_HOLE_RE = re.compile(r"(?:\s*\.\s*){2,}")
+_ORPHAN_CONJUNCTION_RE = re.compile(r"\b(?:also|and)\s*$", re.IGNORECASE)
+_TRAILING_PERIOD_RE = re.compile(r"\s*\.\s*$")
+
 # Lifestyle keyword → canonical lifestyle flag
 _LIFESTYLE_MAP = {
     "alcohol": "no alcohol",
@@ -297,7 +329,7 @@ _GENERAL_QUESTION_RES = [
 # ---------------------------------------------------------------------------
 # Data class for parsed result
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParsedIntent:
     """Result of intent detection."""
     intent: str  # PROFILE_UPDATE | INGREDIENT_QUERY | MIXED | GREETING | GENERAL_QUESTION
@@ -319,6 +351,8 @@ class ParsedIntent:
 # ---------------------------------------------------------------------------
 def _extract_diet(query: str) -> Tuple[Optional[str], str]:
     """Return (canonical_diet_name, remaining_query) or (None, query)."""
+    if not _DIET_CUE_RE.search(query):
+        return None, query
     for pat in _PROFILE_PATTERNS:
         m = pat.search(query)
         if m:
@@ -326,8 +360,8 @@ def _extract_diet(query: str) -> Tuple[Optional[str], str]:
             canonical = DIET_KEYWORDS.get(matched)
             if canonical:
                 remaining = (query[: m.start()] + " " + query[m.end() :]).strip()
-                remaining = re.sub(r"^\s*[,;.]+\s*", "", remaining).strip()
-                remaining = re.sub(r"\s+", " ", remaining)
+                remaining = _LEADING_PUNCT_RE.sub("", remaining).strip()
+                remaining = _WHITESPACE_RE.sub(" ", remaining)
                 return canonical, remaining
     return None, query
 
@@ -337,7 +371,7 @@ def _extract_allergens(query: str) -> Tuple[List[str], str]:
     allergens: List[str] = []
     remaining = query
     # Multiple allergy clauses are common ("peanut allergy. Also allergic to soy").
-    progressed = True
+    progressed = bool(_ALLERGY_CUE_RE.search(remaining))
     while progressed:
         progressed = False
         for pat in _ALLERGEN_PATTERNS:
@@ -345,23 +379,21 @@ def _extract_allergens(query: str) -> Tuple[List[str], str]:
             if not m:
                 continue
             raw = m.group(1).strip()
-            for a in re.split(r"\s*(?:,|and)\s*", raw):
+            for a in _ALLERGEN_LIST_SPLIT_RE.split(raw):
                 a = a.strip().lower()
-                if not a or a in {"a", "an", "my", "the", "to", "of"}:
+                if not a or a in _ALLERGEN_FILLER_WORDS:
                     continue
-                if a in {"allergy", "allergies", "allergen", "allergens"}:
-                    continue
-                if a and a not in allergens:
+                if a not in allergens:
                     allergens.append(a)
             remaining = (remaining[: m.start()] + " " + remaining[m.end() :]).strip()
-            remaining = re.sub(r"\s+", " ", remaining)
+            remaining = _WHITESPACE_RE.sub(" ", remaining)
             progressed = True
             break
     # Excision often leaves orphan conjunctions / dotted holes: "peanut. . . Also"
-    remaining = re.sub(r"(?:\s*\.\s*){2,}", ". ", remaining)
-    remaining = re.sub(r"\b(?:also|and)\s*$", "", remaining, flags=re.IGNORECASE)
-    remaining = re.sub(r"\s*\.\s*$", "", remaining)
-    remaining = re.sub(r"\s+", " ", remaining).strip()
+    remaining = _DOTTED_HOLE_RE.sub(". ", remaining)
+    remaining = _ORPHAN_CONJUNCTION_RE.sub("", remaining)
+    remaining = _TRAILING_PERIOD_RE.sub("", remaining)
+    remaining = _WHITESPACE_RE.sub(" ", remaining).strip()
     return allergens, remaining
 
 
@@ -369,16 +401,18 @@ def _extract_allergen_removals(query: str) -> Tuple[List[str], str]:
     """Return ([allergens_to_remove], remaining_query)."""
     removals: List[str] = []
     remaining = query
+    if not _ALLERGY_CUE_RE.search(query):
+        return removals, remaining
     for pat in _ALLERGEN_REMOVE_PATTERNS:
         m = pat.search(remaining)
         if m:
             raw = m.group(1).strip()
-            for a in re.split(r"\s*(?:,|and)\s*", raw):
+            for a in _ALLERGEN_LIST_SPLIT_RE.split(raw):
                 a = a.strip().lower()
                 if a:
                     removals.append(a)
             remaining = (remaining[: m.start()] + " " + remaining[m.end() :]).strip()
-            remaining = re.sub(r"\s+", " ", remaining)
+            remaining = _WHITESPACE_RE.sub(" ", remaining)
     return removals, remaining
 
 
@@ -386,6 +420,8 @@ def _extract_lifestyle(query: str) -> Tuple[List[str], str]:
     """Return ([lifestyle_flags], remaining_query)."""
     flags: List[str] = []
     remaining = query
+    if not _LIFESTYLE_CUE_RE.search(query):
+        return flags, remaining
     for pat in _LIFESTYLE_PATTERNS:
         m = pat.search(remaining)
         if m:
@@ -394,17 +430,22 @@ def _extract_lifestyle(query: str) -> Tuple[List[str], str]:
             if flag and flag not in flags:
                 flags.append(flag)
             remaining = (remaining[: m.start()] + " " + remaining[m.end() :]).strip()
-            remaining = re.sub(r"\s+", " ", remaining)
+            remaining = _WHITESPACE_RE.sub(" ", remaining)
     return flags, remaining
 
 
 def _strip_duplicate_ingredient_label_block(text: str) -> str:
     """Select the primary ingredient block from pasted multi-section labels."""
-    from core.parsing.label_text import select_ingredient_label_text
-
     return select_ingredient_label_text(text)
 
 
+_INGREDIENTS_HEADER_RE = re.compile(r"\bingredients?\s*[:;]", re.IGNORECASE)
+_EMPTY_INGREDIENTS_HEADER_RE = re.compile(r"\bingredients?\s*[:;]\s*$", re.IGNORECASE)
+_META_INGREDIENTS_FOR_RE = re.compile(
+    r"these?\s+ingredients?\s+for\b|^ingredients?\s+for\b", re.IGNORECASE
+)
+
+
 def _has_ingredient_list_indicator(text: str) -> bool:
     """
     Only treat content as ingredients if there is a clear list signal:
@@ -413,7 +454,7 @@ def _has_ingredient_list_indicator(text: str) -> bool:
     Avoids treating e.g. 'Check these ingredients for gluten' as an ingredient list.
     """
     t = (text or "").strip()
-    if re.search(r"\bingredients?\s*[:;]", t, re.IGNORECASE):
+    if _INGREDIENTS_HEADER_RE.search(t):
         return True
     if "," in t:
         # Require comma and some content either side (not just "word, word" as phrase)
@@ -423,10 +464,8 @@ def _has_ingredient_list_indicator(text: str) -> bool:
     return False
 
 
-def _is_non_ingredient_capture(raw: str) -> bool:
-    """Reject meta placeholders from analyze/check patterns."""
-    r = (raw or "").strip().lower().rstrip(".,;:!?")
-    if r in {
+_NON_INGREDIENT_CAPTURES = frozenset(
+    {
         "this",
         "these",
         "that",
@@ -436,32 +475,55 @@ def _is_non_ingredient_capture(raw: str) -> bool:
         "this for me",
         "ingredients",
         "ingredient",
-    }:
+    }
+)
+_THIS_FOR_ME_RE = re.compile(r"^(?:this|these|that)\s+for\s+me$")
+_LEADING_ALLERGIC_TO_RE = re.compile(r"^(?:and\s+)?allergic\s+to\b")
+_ALLERGIC_TO_RE = re.compile(r"\ballergic\s+to\b")
+_FOOD_BEFORE_ALLERGIC_RE = re.compile(
+    r"\b(?:milk|egg|peanut|soy|wheat|fish|shellfish|sesame|tree\s*nut)s?\b.*\ballergic\b"
+)
+_LEADING_ALLERGIC_RE = re.compile(r"^(?:and\s+)?allergic\b")
+
+
+def _is_non_ingredient_capture(raw: str) -> bool:
+    """Reject meta placeholders from analyze/check patterns."""
+    r = (raw or "").strip().lower().rstrip(".,;:!?")
+    if r in _NON_INGREDIENT_CAPTURES:
         return True
-    if re.match(r"^(?:this|these|that)\s+for\s+me$", r):
+    if _THIS_FOR_ME_RE.match(r):
         return True
-    if re.match(r"^(?:and\s+)?allergic\s+to\b", r):
+    # Every remaining rule is about allergy prose.
+    if "allergic" not in r:
+        return False
+    if _LEADING_ALLERGIC_TO_RE.match(r):
         return True
-    if re.search(r"\ballergic\s+to\b", r) and not re.search(
-        r"\b(?:milk|egg|peanut|soy|wheat|fish|shellfish|sesame|tree\s*nut)s?\b.*\ballergic\b",
-        r,
-    ):
+    if _ALLERGIC_TO_RE.search(r) and not _FOOD_BEFORE_ALLERGIC_RE.search(r):
         # Pure allergen-prose chunks ("allergic to fish") are never food atoms.
         # Keep real foods that merely contain the substring unlikely; allergen
         # sentences are short and start with allergic/and allergic.
-        if re.match(r"^(?:and\s+)?allergic\b", r) or r.endswith("allergy"):
+        if _LEADING_ALLERGIC_RE.match(r) or r.endswith("allergy"):
             return True
     return False
 
 
 def _is_meta_ingredient_phrase(raw: str) -> bool:
     """Treat 'these ingredients for X' / 'ingredients for X' as request for list, not an ingredient list."""
-    r = (raw or "").strip()
-    if re.search(r"these?\s+ingredients?\s+for\b", r, re.IGNORECASE):
-        return True
-    if re.search(r"^ingredients?\s+for\b", r, re.IGNORECASE):
-        return True
-    return False
+    return bool(_META_INGREDIENTS_FOR_RE.search((raw or "").strip()))
+
+
+_PROSE_LEADING_VERB_RE = re.compile(
+    r"^(?:check|analyze|evaluate|test|verify)\s*[:\-]?\s+", re.IGNORECASE
+)
+_PROSE_TRAILING_POLITE_RE = re.compile(
+    r"\s+(?:for\s+(?:me|my\s+\w+)|please|thanks|thank\s+you)\s*$", re.IGNORECASE
+)
+_PROSE_ALLERGIC_TO_TAIL_RE = re.compile(r"[.\s]+(?:and\s+)?allergic\s+to\b.*$", re.IGNORECASE)
+_PROSE_HAVE_ALLERGY_TAIL_RE = re.compile(
+    r"[.\s]+(?:i\s+have|i'?m|i\s+am)\s+(?:a\s+)?\w+\s+allergy\b.*$", re.IGNORECASE
+)
+_PROSE_DOT_RESIDUE_RE = re.compile(r"(?:\s*\.\s*){2,}.*$")
+_PROSE_ALSO_AND_TAIL_RE = re.compile(r"[.\s]+(?:also|and)\s*$", re.IGNORECASE)
 
 
 def _strip_trailing_request_prose(chunk: str) -> str:
@@ -470,34 +532,17 @@ def _strip_trailing_request_prose(chunk: str) -> str:
     if not t:
         return t
     # "check: potato" / "analyze sugar" left after comma-split fallbacks
-    t = re.sub(
-        r"^(?:check|analyze|evaluate|test|verify)\s*[:\-]?\s+",
-        "",
-        t,
-        flags=re.IGNORECASE,
-    ).strip()
-    t = re.sub(
-        r"\s+(?:for\s+(?:me|my\s+\w+)|please|thanks|thank\s+you)\s*$",
-        "",
-        t,
-        flags=re.IGNORECASE,
-    ).strip()
-    # "salt. allergic to peanuts" / "eggs. allergic to gluten"
-    t = re.sub(
-        r"[.\s]+(?:and\s+)?allergic\s+to\b.*$",
-        "",
-        t,
-        flags=re.IGNORECASE,
-    ).strip()
-    t = re.sub(
-        r"[.\s]+(?:i\s+have|i'?m|i\s+am)\s+(?:a\s+)?\w+\s+allergy\b.*$",
-        "",
-        t,
-        flags=re.IGNORECASE,
-    ).strip()
+    t = _PROSE_LEADING_VERB_RE.sub("", t).strip()
+    t = _PROSE_TRAILING_POLITE_RE.sub("", t).strip()
+    # Allergy tails only exist when the chunk mentions an allergy at all.
+    if "allerg" in t.lower():
+        # "salt. allergic to peanuts" / "eggs. allergic to gluten"
+        t = _PROSE_ALLERGIC_TO_TAIL_RE.sub("", t).strip()
+        t = _PROSE_HAVE_ALLERGY_TAIL_RE.sub("", t).strip()
     # Residue from multi-allergy excision: "peanut. . . also"
-    t = re.sub(r"(?:\s*\.\s*){2,}.*$", "", t).strip()
-    t = re.sub(r"[.\s]+(?:also|and)\s*$", "", t, flags=re.IGNORECASE).strip()
+    if t.count(".") >= 2:
+        t = _PROSE_DOT_RESIDUE_RE.sub("", t).strip()
+    t = _PROSE_ALSO_AND_TAIL_RE.sub("", t).strip()
     return t
 
 
@@ -518,7 +563,7 @@ def _extract_ingredients_from_text(text: str) -> List[str]:
             if not raw or _is_meta_ingredient_phrase(raw) or _is_non_ingredient_capture(raw):
                 # Empty "Ingredients:" capture — do not fall through to treating
                 # the header itself as an ingredient atom.
-                if re.search(r"\bingredients?\s*[:;]\s*$", text, re.IGNORECASE):
+                if _EMPTY_INGREDIENTS_HEADER_RE.search(text):
                     return []
                 if not raw:
                     continue
@@ -578,6 +623,19 @@ def _split_by_comma_outside_parens(text: str) -> List[str]:
     return chunks
 
 
+_SPLIT_DROP_MARKS = str.maketrans("", "", "?!")
+_SPLIT_TRAILING_QUESTION_RE = re.compile(
+    r"\.\s+(?:is|are|does|do|can|should|what|how|why|will|could|would)\b.*$", re.IGNORECASE
+)
+_SPLIT_AND_RE = re.compile(r"\s+(?:and|&)\s+", re.IGNORECASE)
+_SPLIT_OR_RE = re.compile(r"\s+or\s+", re.IGNORECASE)
+_SPLIT_TRAILING_NOISE_RE = re.compile(r"[\s.]+$")
+_SPLIT_WITH_RE = re.compile(r"^(.+?)\s+with\s+(.+)$", re.IGNORECASE)
+_SPLIT_STOPWORDS = frozenset(
+    {"the", "a", "an", "some", "any", "this", "that", "it", "for", "me", "my", "in", "on", "to"}
+)
+
+
 def _split_ingredients(text: str) -> List[str]:
     """Split ingredient text into a deduplicated list.
 
@@ -585,24 +643,24 @@ def _split_ingredients(text: str) -> List[str]:
     stays as one ingredient for the bridge to expand). Preserves compound items like
     'burger with chicken' when the left side is a known product/container word.
     """
-    from core.parsing.label_normalize import _protect_and_phrases, _restore_and_phrases
-
-    t = re.sub(r"[?\!]+", "", text).strip()
+    t = text.translate(_SPLIT_DROP_MARKS).strip()
     # Strip trailing question/sentence after a period (e.g. "Water. Is this Halal" → "Water")
-    t = re.sub(r"\.\s+(?:is|are|does|do|can|should|what|how|why|will|could|would)\b.*$", "", t, flags=re.IGNORECASE).strip()
+    t = _SPLIT_TRAILING_QUESTION_RE.sub("", t).strip()
     # Protect "herbs and spices" / "mono and diglycerides" before treating "and" as a comma.
     protected, placeholders = _protect_and_phrases(t)
-    protected = re.sub(r"\s+(?:and|&)\s+", ", ", protected, flags=re.IGNORECASE)
-    protected = re.sub(r"\s+or\s+", ", ", protected, flags=re.IGNORECASE)
+    protected = _SPLIT_AND_RE.sub(", ", protected)
+    protected = _SPLIT_OR_RE.sub(", ", protected)
     t = _restore_and_phrases(protected, placeholders)
-    stopwords = {"the", "a", "an", "some", "any", "this", "that", "it", "for", "me", "my", "in", "on", "to"}
+    stopwords = _SPLIT_STOPWORDS
     result: List[str] = []
     seen: set = set()
 
     for chunk in _split_by_comma_outside_parens(t):
         # Strip leftover period/space noise from allergen excision
         # (e.g. "Peanut. ." / "Peanut. " after removing "I have a peanut allergy").
-        chunk = re.sub(r"[\s.]+$", "", chunk.strip()).strip()
+        chunk = chunk.strip()
+        if chunk.endswith("."):
+            chunk = _SPLIT_TRAILING_NOISE_RE.sub("", chunk).strip()
         chunk = _strip_trailing_request_prose(chunk)
         if not chunk or len(chunk) < 2:
             continue
@@ -613,7 +671,7 @@ def _split_ingredients(text: str) -> List[str]:
             continue
 
         # Check for "X with Y" compound
-        with_match = re.match(r"^(.+?)\s+with\s+(.+)$", chunk, re.IGNORECASE)
+        with_match = _SPLIT_WITH_RE.match(chunk)
         if with_match:
             left = with_match.group(1).strip()
             right = with_match.group(2).strip()
@@ -714,15 +772,31 @@ def _matches_known_ingredient(text: str) -> bool:
 
 
 _QWERTY_HOME_ROW = frozenset("asdfghjkl")
+_NON_ALPHA_RE = re.compile(r"[^a-z]")
+_VOWEL_RE = re.compile(r"[aeiouy]")
+_DIGIT_RE = re.compile(r"\d")
+_FOOD_TOKEN_CHARS_RE = re.compile(r"^[a-z0-9][a-z0-9\s\-./()%]*$", re.IGNORECASE)
+_MATH_OPERATOR_RE = re.compile(r"[+*/=]")
+_URL_RE = re.compile(r"https?://|www\.", re.IGNORECASE)
+_CHECK_THIS_RE = re.compile(
+    r"^(?:check|analyze|evaluate|verify|test)\s+(?:this|these|that)\b", re.IGNORECASE
+)
+# Weather / "what's" / "will it" / WH-questions: one scan instead of four.
+_NON_FOOD_QUESTION_RE = re.compile(
+    r"\b(?:weather|forecast)\b"
+    r"|^what'?s\b"
+    r"|^will\s+it\b"
+    r"|^(?:what|how|why|when|where|who|which|tell\s+me\s+about|explain)\s+"
+)
 
 
 def _looks_like_keyboard_mash(text: str) -> bool:
-    alpha = re.sub(r"[^a-z]", "", (text or "").lower())
+    alpha = _NON_ALPHA_RE.sub("", (text or "").lower())
     if len(alpha) < 5:
         return False
     if all(c in _QWERTY_HOME_ROW for c in alpha):
         return True
-    return not re.search(r"[aeiouy]", alpha)
+    return not _VOWEL_RE.search(alpha)
 
 
 def _is_food_like_token(token: str) -> bool:
@@ -735,12 +809,12 @@ def _is_food_like_token(token: str) -> bool:
     compact = low.replace(" ", "")
     if _E_NUMBER_RE.match(compact):
         return True
-    if not re.match(r"^[a-z0-9][a-z0-9\s\-./()%]*$", low, re.IGNORECASE):
+    if not _FOOD_TOKEN_CHARS_RE.match(low):
         return False
-    alpha = re.sub(r"[^a-z]", "", low)
-    if len(alpha) >= 2 and re.search(r"[aeiouy]", alpha):
+    alpha = _NON_ALPHA_RE.sub("", low)
+    if len(alpha) >= 2 and _VOWEL_RE.search(alpha):
         return True
-    return bool(re.search(r"\d", t))
+    return bool(_DIGIT_RE.search(t))
 
 
 def _is_garbage_ingredient_line(text: str) -> bool:
@@ -749,49 +823,41 @@ def _is_garbage_ingredient_line(text: str) -> bool:
         return True
     if _PROMPT_INJECTION_RE.search(text):
         return True
-    if _MATH_EXPRESSION_RE.match(text) and re.search(r"[+*/=]", text):
+    if _MATH_EXPRESSION_RE.match(text) and _MATH_OPERATOR_RE.search(text):
         return True
     return _looks_like_keyboard_mash(text)
 
 
-def _is_plausible_ingredient_query(text: str) -> bool:
+def _bare_line_gate(text: str) -> Optional[str]:
     """
-    Gate bare-ingredient fallback: accept known food aliases or food-like text;
-    reject math, literals, prompt injection, greetings, and keyboard mash.
+    Shared front half of the bare-line checks: return the cleaned line, or None
+    for empty/long/multi-line text, URLs, denylisted or diet-only words, meta
+    phrases and non-food questions. Cleans and lowercases the line once.
     """
     t = (text or "").strip()
     if not t or len(t) > 120 or "\n" in t:
-        return False
-    if re.search(r"https?://|www\.", t, re.IGNORECASE):
-        return False
+        return None
+    if _URL_RE.search(t):
+        return None
 
     cleaned = _clean_for_ingredients(t.strip(".,;:!? ").strip())
     if not cleaned:
-        return False
+        return None
 
     low = cleaned.lower().strip()
     if low in _BARE_QUERY_DENYLIST or low in _DIET_NAMES_LOWER:
-        return False
+        return None
     if _is_meta_ingredient_phrase(cleaned):
-        return False
-    if re.match(
-        r"^(?:check|analyze|evaluate|verify|test)\s+(?:this|these|that)\b",
-        cleaned,
-        re.IGNORECASE,
-    ):
-        return False
-    if re.search(r"\b(?:weather|forecast)\b", low):
-        return False
-    if re.match(r"^what'?s\b", low):
-        return False
-    if re.match(r"^will\s+it\b", low):
-        return False
-    if re.match(
-        r"^(?:what|how|why|when|where|who|which|tell\s+me\s+about|explain)\s+",
-        low,
-    ):
-        return False
+        return None
+    # Weather, "what's"/"will it", and obvious general-knowledge questions are
+    # not a label or ingredient line.
+    if _CHECK_THIS_RE.match(cleaned) or _NON_FOOD_QUESTION_RE.search(low):
+        return None
+    return cleaned
+
 
+def _is_plausible_bare_line(cleaned: str) -> bool:
+    """Known food alias, or food-like chunks that are not math/literals/keyboard mash."""
     if _matches_known_ingredient(cleaned):
         return True
     if _is_garbage_ingredient_line(cleaned):
@@ -801,71 +867,73 @@ def _is_plausible_ingredient_query(text: str) -> bool:
     return all(_is_food_like_token(c) for c in chunks if c.strip())
 
 
-def _bare_ingredients_fallback(text: str) -> List[str]:
+def _split_bare_line(cleaned: str) -> List[str]:
+    n_words = len(cleaned.split())
+    if n_words < 1 or n_words > 10:
+        return []
+    return _split_ingredients(cleaned)
+
+
+def _is_plausible_ingredient_query(text: str) -> bool:
+    """
+    Gate bare-ingredient fallback: accept known food aliases or food-like text;
+    reject math, literals, prompt injection, greetings, and keyboard mash.
+    """
+    cleaned = _bare_line_gate(text)
+    return cleaned is not None and _is_plausible_bare_line(cleaned)
+
+
+def _plausible_bare_ingredients(text: str) -> Optional[List[str]]:
     """
     Treat a short, non-question line as ingredient(s) when it is not a list signal
     (no comma / no 'ingredients:') — e.g. 'milk', 'eggs', 'soy milk', 'red 40'.
 
-    Skips meta phrases ('these ingredients for…'), WH-questions, and diet-only tokens.
+    Returns None when the line is not a plausible ingredient query (meta phrases,
+    WH-questions, diet-only tokens, garbage); the gate runs once for both checks.
     """
-    t = (text or "").strip()
-    if not t or len(t) > 120 or "\n" in t:
-        return []
-    if re.search(r"https?://|www\.", t, re.IGNORECASE):
-        return []
-    t = t.strip(".,;:!? ").strip()
-    if not t:
-        return []
-    cleaned = _clean_for_ingredients(t)
-    if not cleaned:
-        return []
-    low = cleaned.lower().strip()
-    if low in _BARE_QUERY_DENYLIST or low in _DIET_NAMES_LOWER:
-        return []
-    if _is_meta_ingredient_phrase(cleaned):
-        return []
-    if re.match(r"^(?:check|analyze|evaluate|verify|test)\s+(?:this|these|that)\b", cleaned, re.IGNORECASE):
-        return []
-    if re.search(r"\b(?:weather|forecast)\b", low):
-        return []
-    if re.match(r"^what'?s\b", low):
-        return []
-    if re.match(r"^will\s+it\b", low):
-        return []
-    # Obvious general-knowledge questions, not a label or ingredient line
-    if re.match(
-        r"^(?:what|how|why|when|where|who|which|tell\s+me\s+about|explain)\s+",
-        low,
-    ):
-        return []
-    n_words = len(cleaned.split())
-    if n_words < 1 or n_words > 10:
-        return []
-    ings = _split_ingredients(cleaned)
-    return ings
+    cleaned = _bare_line_gate(text)
+    if cleaned is None or not _is_plausible_bare_line(cleaned):
+        return None
+    return _split_bare_line(cleaned)
+
+
+_CLEAN_GREETING_PREFIX_RE = re.compile(r"^(?:hi|hello|hey|please|kindly)\b\s*,?\s*", re.IGNORECASE)
+_CLEAN_POLITE_REQUEST_RE = re.compile(
+    r"\b(?:please|kindly|could\s+you|would\s+you|can\s+you)\s+(?:check|tell\s+me|let\s+me\s+know)\s*",
+    re.IGNORECASE,
+)
+_CLEAN_FOR_ME_RE = re.compile(r"\bfor\s+(?:me|my\s+\w+)\b", re.IGNORECASE)
+_CLEAN_HEADER_RE = re.compile(r"^(?:ingredients?)\s*[:;]\s*", re.IGNORECASE)
+_CLEAN_TRAILING_QMARK_RE = re.compile(r"\s*\?+\s*$")
+_CLEAN_CONVERSATIONAL_WORD_RE = re.compile(
+    r"\b(?:think|know|explain|describe|tell|help|find|suggest|recommend|brainstorm|alternative"
+    r"|substitute|replace|instead|option|recipe)\b",
+    re.IGNORECASE,
+)
+_CLEAN_SMALL_TALK_RE = re.compile(
+    r"^(?:how\s+are\s+you|how'?s?\s+it\s+going|how\s+do\s+you\s+do|thank|thanks|bye|goodbye|ok|okay"
+    r"|cool|nice|great|awesome|yes|no|yep|yeah|sure|nah)\b",
+    re.IGNORECASE,
+)
 
 
 def _clean_for_ingredients(text: str) -> str:
     """Strip conversational fluff; return empty string if nothing ingredient-like remains."""
     t = text.strip()
-    t = re.sub(r"^(?:hi|hello|hey|please|kindly)\b\s*,?\s*", "", t, flags=re.IGNORECASE)
-    t = re.sub(r"\b(?:please|kindly|could\s+you|would\s+you|can\s+you)\s+(?:check|tell\s+me|let\s+me\s+know)\s*", "", t, flags=re.IGNORECASE)
-    t = re.sub(r"\bfor\s+(?:me|my\s+\w+)\b", "", t, flags=re.IGNORECASE)
+    t = _CLEAN_GREETING_PREFIX_RE.sub("", t)
+    t = _CLEAN_POLITE_REQUEST_RE.sub("", t)
+    t = _CLEAN_FOR_ME_RE.sub("", t)
     # Bare / empty Ingredients: header is not an ingredient list.
-    t = re.sub(r"^(?:ingredients?)\s*[:;]\s*", "", t, flags=re.IGNORECASE).strip()
+    t = _CLEAN_HEADER_RE.sub("", t).strip()
     if not t or t.lower().rstrip(".:;") in {"ingredient", "ingredients"}:
         return ""
-    t = re.sub(r"\s*\?+\s*$", "", t)
-    t = re.sub(r"\s+", " ", t).strip()
+    t = _CLEAN_TRAILING_QMARK_RE.sub("", t)
+    t = _WHITESPACE_RE.sub(" ", t).strip()
     # Reject conversational phrases and request for help
-    if re.search(r"\b(?:think|know|explain|describe|tell|help|find|suggest|recommend|brainstorm|alternative|substitute|replace|instead|option|recipe)\b", t, re.IGNORECASE):
+    if _CLEAN_CONVERSATIONAL_WORD_RE.search(t):
         return ""
     # Reject greetings / conversational noise that survived stripping
-    if re.match(
-        r"^(?:how\s+are\s+you|how'?s?\s+it\s+going|how\s+do\s+you\s+do|thank|thanks|bye|goodbye|ok|okay"
-        r"|cool|nice|great|awesome|yes|no|yep|yeah|sure|nah)\b",
-        t, re.IGNORECASE,
-    ):
+    if _CLEAN_SMALL_TALK_RE.match(t):
         return ""
     return t
 
@@ -932,19 +1000,33 @@ def detect_intent(query: str) -> ParsedIntent:
         "eggs, milk, flour"
             → INGREDIENT_QUERY  ingredients=["eggs", "milk", "flour"]
     """
-    query = (query or "").strip()
+    cached = _detect_intent_cached(query or "")
+    # The memoized result is shared; callers get their own dict/lists to mutate.
+    return ParsedIntent(
+        intent=cached.intent,
+        profile_updates={
+            k: list(v) if isinstance(v, list) else v for k, v in cached.profile_updates.items()
+        },
+        ingredients=list(cached.ingredients),
+        original_query=cached.original_query,
+    )
+
+
+# Detection is a pure function of the query text (static pattern tables only),
+# and chat clients resend the same short questions; cache_info() reports hits.
+@lru_cache(maxsize=2048)
+def _detect_intent_cached(query: str) -> ParsedIntent:
+    query = query.strip()
     if not query:
         return ParsedIntent(intent="GENERAL_QUESTION", original_query=query)
 
-    from core.parsing.label_text import fix_ocr_label_noise
-
     query = fix_ocr_label_noise(query)
 
     # Typo normalization so diet detection works on e.g. "vegeterian", "im veg"
     query = normalize_query_for_typos(query)
 
     # /update command
-    if query.lstrip().lower().startswith("/update"):
+    if query.lstrip()[:7].lower() == "/update":
         return ParsedIntent(intent="PROFILE_UPDATE", original_query=query)
 
     # Greetings & conversational phrases
@@ -1023,10 +1105,11 @@ def detect_intent(query: str) -> ParsedIntent:
         # Bare ingredient line: "milk", "eggs", "soy milk" (no comma / no "ingredients:")
         if not ingredients:
             target = remaining.strip()
-            if target and _is_plausible_ingredient_query(target):
-                ingredients = _bare_ingredients_fallback(target)
-            elif not profile_updates and _is_plausible_ingredient_query(base_text):
-                ingredients = _bare_ingredients_fallback(base_text)
+            bare = _plausible_bare_ingredients(target) if target else None
+            if bare is None and not profile_updates:
+                bare = _plausible_bare_ingredients(base_text)
+            if bare is not None:
+                ingredients = bare
 
     # Filter out diet names that leaked into ingredients
     if ingredients:
@@ -33,6 +33,9 @@ class ResolvedIngredient:
 
 _CACHE: dict[str, ResolvedIngredient] = {}
 _SEEDED = False
+# Bumped on every clear() so derived caches (e.g. the bridge's per-label
+# result cache) can tell their entries were built from a dropped resolution.
+_GENERATION = 0
 
 
 def cache_key(atom: str, region: Optional[str]) -> str:
@@ -50,9 +53,15 @@ def put(key: str, resolved: ResolvedIngredient) -> None:
 
 def clear() -> None:
     """Test-only: drop all cached entries and force a reseed on next resolve()."""
-    global _SEEDED
+    global _SEEDED, _GENERATION
     _CACHE.clear()
     _SEEDED = False
+    _GENERATION += 1
+
+
+def generation() -> int:
+    """Counter that changes whenever the cache is cleared."""
+    return _GENERATION
 
 
 def seed_tier1() -> None:
@@ -80,6 +80,13 @@ def _alternate_keys(norm: str) -> list[str]:
     return out
 
 
+def warm_up() -> None:
+    """Seed Tier 1 and build the Tier-2 ontology index ahead of the first
+    request, so the first chat turn does not pay the index build. Zero network."""
+    cache.seed_tier1()
+    local_ontology.lookup("salt")
+
+
 def resolve(atom: str, region: Optional[str]) -> ResolvedIngredient:
     cache.seed_tier1()
     # Normalize once: chat lists often arrive Title-Cased ("Beets"), while
@@ -16,6 +16,7 @@ from core.knowledge.ike2.compliance import evaluate
 from core.knowledge.ike2.seam import to_compliance_input
 from core.knowledge.ike2.shadow.comparator import compare
 from core.knowledge.ike2.verdict import to_external
+from core.knowledge.ontology_cache import OntologyBoundCache
 
 logger = logging.getLogger(__name__)
 
@@ -71,6 +72,21 @@ def ike2_external_verdict(
     return to_external(result.verdict)
 
 
+def _build_legacy_engine():
+    from core.evaluation.compliance_engine import ComplianceEngine
+
+    return ComplianceEngine()
+
+
+# Diffs run on every chat turn, so one legacy engine is shared and rebuilt only
+# when either ontology file changes on disk.
+_legacy_engine = OntologyBoundCache(_build_legacy_engine)
+
+
+def _get_legacy_engine():
+    return _legacy_engine.get()
+
+
 def legacy_external_verdict(
     raw_ingredients,
     restriction_ids,
@@ -89,7 +105,6 @@ def legacy_external_verdict(
     IKE-2-only, routing through it here would compare IKE-2 to itself.
     """
     from core.bridge import preprocess_ingredient_list
-    from core.evaluation.compliance_engine import ComplianceEngine
     from core.normalization.normalizer import substance_key
 
     if decomposed_atoms is not None:
@@ -104,7 +119,7 @@ def legacy_external_verdict(
             raw_ingredients
         )
 
-    verdict = ComplianceEngine().evaluate(
+    verdict = _get_legacy_engine().evaluate(
         atomic_names,
         restriction_ids=restriction_ids,
         trace_ingredient_keys=trace_keys or None,
@@ -119,15 +134,14 @@ def _log_diff(diff) -> None:
         logger.debug("Skipping _log_diff: interpreter is finalizing")
         return
 
-    from core.knowledge.ingredient_db import get_supabase_config
+    # Shared store client: a diff burst must not open a new connection per row.
+    from core.knowledge.ike2.stores.db import get_client
 
-    cfg = get_supabase_config()
-    if not cfg:
+    client = get_client()
+    if client is None:
         return
-    from supabase import create_client
-
     try:
-        create_client(cfg.url, cfg.key).table("ike2_shadow_diffs").insert(
+        client.table("ike2_shadow_diffs").insert(
             {
                 "raw_input": diff["raw_input"],
                 "legacy_verdict": diff["legacy_verdict"],
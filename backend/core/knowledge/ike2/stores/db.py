@@ -25,6 +25,13 @@ def _supabase():
     return _client
 
 
+def get_client():
+    """Shared store client, or None when Supabase is not configured."""
+    if not get_supabase_config():
+        return None
+    return _supabase()
+
+
 def _alias_rows(normalized_alias: str):
     return (
         _supabase()
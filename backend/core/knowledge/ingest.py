@@ -124,20 +124,13 @@ def ensure_group_with_aliases(
         ingredient_id = ing_ins.data[0]["id"]
     else:
         ingredient_id = ing_sel.data[0]["id"]
-    # Add aliases (canonical + list); skip if normalized_alias already exists
+    # Add aliases (canonical + list); skip if normalized_alias already exists.
+    # One existence query and one bulk insert instead of two round trips per alias.
     to_add = [canonical_name] + [a for a in aliases if a and a != canonical_name]
+    pending: Dict[str, Dict[str, Any]] = {}
     for raw in to_add:
         norm = normalize_ingredient_key(raw)
-        if not norm:
-            continue
-        existing = (
-            client.table("ingredient_aliases")
-            .select("id")
-            .eq("normalized_alias", norm)
-            .limit(1)
-            .execute()
-        )
-        if existing.data:
+        if not norm or norm in pending:
             continue
         payload: Dict[str, Any] = {
             "alias": raw,
@@ -148,8 +141,28 @@ def ensure_group_with_aliases(
         }
         if region is not None:
             payload["region"] = region
-        try:
-            client.table("ingredient_aliases").insert(payload).execute()
-        except Exception as e:
-            logger.debug("ingest alias insert skip norm=%s: %s", norm[:40], e)
+        pending[norm] = payload
+    if not pending:
+        return group_id
+    existing = (
+        client.table("ingredient_aliases")
+        .select("normalized_alias")
+        .in_("normalized_alias", list(pending))
+        .execute()
+    )
+    for row in existing.data or []:
+        pending.pop(row.get("normalized_alias"), None)
+    rows = list(pending.values())
+    if not rows:
+        return group_id
+    try:
+        client.table("ingredient_aliases").insert(rows).execute()
+    except Exception as e:
+        # A single conflicting row fails the whole batch; retry row by row so the rest still land.
+        logger.debug("ingest alias batch insert failed n=%d, retrying per row: %s", len(rows), e)
+        for payload in rows:
+            try:
+                client.table("ingredient_aliases").insert(payload).execute()
+            except Exception as row_exc:
+                logger.debug("ingest alias insert skip norm=%s: %s", payload["normalized_alias"][:40], row_exc)
     return group_id
@@ -12,11 +12,39 @@ from typing import Any, Optional
 import requests
 
 from core.config import get_ollama_url, get_ollama_model, llm_enabled
+from core.llm_http import get_ollama_session, ollama_timeout
 
 logger = logging.getLogger(__name__)
 
 _CLASSIFY_TIMEOUT = 15
 
+# Exact-match cache: (name, description) -> classification. Prompts run at
+# temperature 0, so a repeat of the same ingredient would get the same answer;
+# only successful classifications are stored so a transient Ollama failure is retried.
+_classify_cache: dict[tuple[str, str], dict[str, Any]] = {}
+_CACHE_MAX_ENTRIES = 2048
+
+_ORIGIN_TYPES = ["plant", "animal", "synthetic", "microbial", "fungal", "insect", "unknown"]
+
+# Ollama structured output so the classification always decodes as one JSON object.
+_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "origin_type": {"type": "string", "enum": _ORIGIN_TYPES},
+        "animal_origin": {"type": "boolean"},
+        "plant_origin": {"type": "boolean"},
+        "synthetic": {"type": "boolean"},
+        "egg_source": {"type": "boolean"},
+        "dairy_source": {"type": "boolean"},
+        "gluten_source": {"type": "boolean"},
+        "soy_source": {"type": "boolean"},
+        "nut_source": {"type": ["string", "null"]},
+        "sesame_source": {"type": "boolean"},
+        "animal_species": {"type": ["string", "null"]},
+    },
+    "required": ["origin_type", "animal_origin", "plant_origin"],
+}
+
 _PROMPT = """You are a food ingredient classifier for dietary compliance. Given an ingredient name and optional description, return a JSON object with EXACTLY these boolean or string fields:
 
 - "origin_type": one of "plant", "animal", "synthetic", "microbial", "fungal", "insect", "unknown"
@@ -45,21 +73,26 @@ def classify_ingredient_origin(
     """
     if not llm_enabled() or not name or not name.strip():
         return None
+    cache_key = (name.strip().lower(), (description or "").strip())
+    cached = _classify_cache.get(cache_key)
+    if cached is not None:
+        return dict(cached)
     prompt = f"Ingredient name: {name.strip()}\n"
     if description and description.strip():
         prompt += f"Description: {description.strip()}\n"
     prompt += "Return the JSON classification:"
     try:
-        resp = requests.post(
+        resp = get_ollama_session().post(
             get_ollama_url(),
             json={
                 "model": get_ollama_model(),
                 "prompt": prompt,
                 "system": _PROMPT,
+                "format": _RESPONSE_SCHEMA,
                 "stream": False,
                 "options": {"temperature": 0.0, "num_predict": 200},
             },
-            timeout=timeout,
+            timeout=ollama_timeout(timeout),
         )
         resp.raise_for_status()
         raw = (resp.json().get("response") or "").strip()
@@ -72,12 +105,20 @@ def classify_ingredient_origin(
     try:
         out = json.loads(cleaned)
         if isinstance(out, dict):
+            if len(_classify_cache) >= _CACHE_MAX_ENTRIES:
+                _classify_cache.clear()
+            _classify_cache[cache_key] = dict(out)
             return out
     except json.JSONDecodeError:
         pass
     return None
 
 
+def clear_classification_cache() -> None:
+    """Clear in-memory LLM classification cache (e.g. for tests)."""
+    _classify_cache.clear()
+
+
 def apply_classification_to_ingredient(ing: Any, classification: dict[str, Any]) -> Any:
     """Return a new Ingredient with flags updated from classification dict (from classify_ingredient_origin)."""
     from core.ontology.ingredient_schema import Ingredient
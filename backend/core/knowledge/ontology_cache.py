@@ -0,0 +1,48 @@
+"""
+Process-wide instances that are expensive to build from the ontology files.
+
+Constructing a ComplianceEngine or CanonicalResolver parses the full static +
+dynamic ontology (~0.2s), so callers that run per chat turn or per batch share
+one instance and rebuild it only when either ontology file changes on disk
+(e.g. enrichment appended to the dynamic ontology).
+"""
+import threading
+from typing import Callable, Generic, Optional, Tuple, TypeVar
+
+from core.config import get_dynamic_ontology_path, get_ontology_path
+
+T = TypeVar("T")
+
+
+def ontology_stamp() -> Tuple[Optional[int], ...]:
+    """mtime_ns of the static and dynamic ontology files (None when missing)."""
+    stamp = []
+    for path in (get_ontology_path(), get_dynamic_ontology_path()):
+        try:
+            stamp.append(path.stat().st_mtime_ns)
+        except OSError:
+            stamp.append(None)
+    return tuple(stamp)
+
+
+class OntologyBoundCache(Generic[T]):
+    """One shared instance from ``factory``, rebuilt when ``ontology_stamp()`` changes."""
+
+    def __init__(self, factory: Callable[[], T]):
+        self._factory = factory
+        self._instance: Optional[T] = None
+        self._stamp: Optional[tuple] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> T:
+        stamp = ontology_stamp()
+        with self._lock:
+            if self._instance is None or self._stamp != stamp:
+                self._instance = self._factory()
+                self._stamp = stamp
+            return self._instance
+
+    def clear(self) -> None:
+        with self._lock:
+            self._instance = None
+            self._stamp = None
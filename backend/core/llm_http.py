@@ -0,0 +1,53 @@
+"""
+Shared HTTP session for Ollama calls.
+
+Intent extraction, response composition, ingredient classification and the
+regional-name fallback all talk to the same local Ollama endpoint. A single
+pooled session keeps those connections alive instead of opening a new socket
+per call.
+"""
+import threading
+from typing import Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Enough for the threadpool-offloaded chat calls plus the enrichment workers.
+OLLAMA_POOL_SIZE = 16
+# Seconds to establish a connection. Generation time is bounded separately by
+# each caller's read timeout, so an unreachable host fails fast instead of
+# holding the request for the full generation budget.
+OLLAMA_CONNECT_TIMEOUT = 2
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    # POST is not in Retry's default allowed methods, so only connection
+    # setup is retried; a generation that already started is never replayed.
+    adapter = HTTPAdapter(
+        pool_connections=OLLAMA_POOL_SIZE,
+        pool_maxsize=OLLAMA_POOL_SIZE,
+        max_retries=Retry(total=2, backoff_factor=0.1),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_ollama_session() -> requests.Session:
+    """Process-wide pooled session for Ollama requests (created on first use)."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def ollama_timeout(read_timeout: float) -> Tuple[float, float]:
+    """(connect, read) timeout pair for an Ollama request."""
+    return (OLLAMA_CONNECT_TIMEOUT, read_timeout)
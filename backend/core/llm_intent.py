@@ -13,6 +13,7 @@ from typing import Optional
 import requests
 
 from core.config import get_ollama_url, get_ollama_model, LLM_INTENT_TIMEOUT, llm_enabled
+from core.llm_http import get_ollama_session, ollama_timeout
 
 logger = logging.getLogger(__name__)
 
@@ -38,21 +39,45 @@ RULES:
 - Return ONLY valid JSON. No markdown, no explanation."""
 
 
+_STR_LIST = {"type": "array", "items": {"type": "string"}}
+
+# Ollama structured output: constrains decoding to this shape, so the reply is
+# always parseable JSON (no fences / prose to strip) and stops at the closing brace.
+_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "intent": {
+            "type": "string",
+            "enum": ["PROFILE_UPDATE", "INGREDIENT_QUERY", "MIXED", "GREETING", "GENERAL_QUESTION"],
+        },
+        "dietary_preference": {"type": ["string", "null"]},
+        "ingredients": _STR_LIST,
+        "allergens": _STR_LIST,
+        "lifestyle": _STR_LIST,
+        "remove_allergens": _STR_LIST,
+        "is_greeting": {"type": "boolean"},
+        "is_general_question": {"type": "boolean"},
+    },
+    "required": ["intent", "ingredients"],
+}
+
+
 def _call_ollama(prompt: str, timeout: int = LLM_INTENT_TIMEOUT) -> Optional[str]:
     """Call Ollama and return the response text, or None on failure."""
     if not llm_enabled():
         return None
     try:
-        resp = requests.post(
+        resp = get_ollama_session().post(
             get_ollama_url(),
             json={
                 "model": get_ollama_model(),
                 "prompt": prompt,
                 "system": _SYSTEM_PROMPT,
+                "format": _RESPONSE_SCHEMA,
                 "stream": False,
                 "options": {"temperature": 0.0, "num_predict": 300},
             },
-            timeout=timeout,
+            timeout=ollama_timeout(timeout),
         )
         resp.raise_for_status()
         return resp.json().get("response", "").strip()
@@ -61,18 +86,22 @@ def _call_ollama(prompt: str, timeout: int = LLM_INTENT_TIMEOUT) -> Optional[str
         return None
 
 
+_CODE_FENCE_RE = re.compile(r"```(?:json)?\s*")
+_JSON_OBJECT_RE = re.compile(r"\{[^{}]*\}", re.DOTALL)
+
+
 def _parse_json_response(raw: str) -> Optional[dict]:
     """Extract JSON from LLM response (may contain markdown fences)."""
     if not raw:
         return None
     # Strip markdown code fences
-    cleaned = re.sub(r"```(?:json)?\s*", "", raw)
+    cleaned = _CODE_FENCE_RE.sub("", raw)
     cleaned = cleaned.strip().rstrip("`")
     try:
         return json.loads(cleaned)
     except json.JSONDecodeError:
         # Try to find JSON object in the text
-        match = re.search(r"\{[^{}]*\}", cleaned, re.DOTALL)
+        match = _JSON_OBJECT_RE.search(cleaned)
         if match:
             try:
                 return json.loads(match.group())
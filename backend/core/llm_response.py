@@ -3,13 +3,15 @@ LLM-powered response composer for greetings, profile updates, and general questi
 Used when the app needs natural-language replies (greeting, profile confirmation, general Q&A).
 Verdict responses use the template-based response_composer for consistency and speed.
 """
+import json
 import logging
 import re
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List
 
 import requests
 
 from core.config import get_ollama_url, get_ollama_model, LLM_RESPONSE_TIMEOUT, llm_enabled
+from core.llm_http import get_ollama_session, ollama_timeout
 from core.models.verdict import ComplianceVerdict, VerdictStatus
 from core.response_composer import (
     INGREDIENT_ALTERNATIVES,
@@ -41,27 +43,88 @@ def _trim_explanation(text: str, max_sentences: int = 2, max_chars: int = 260) -
     return trimmed
 
 
+# Replies are generated at temperature 0, so the same (model, system, prompt)
+# yields the same text; verdict explanations in particular repeat for every
+# user with the same diet and flagged ingredient. Only non-empty replies are kept.
+_reply_cache: dict[tuple[str, str, str], str] = {}
+_CACHE_MAX_ENTRIES = 2048
+
+
 def _call_ollama(system: str, prompt: str, timeout: int = LLM_RESPONSE_TIMEOUT) -> Optional[str]:
     """Call Ollama and return the response text, or None on failure."""
     if not llm_enabled():
         return None
+    model = get_ollama_model()
+    cache_key = (model, system, prompt)
+    cached = _reply_cache.get(cache_key)
+    if cached is not None:
+        return cached
     try:
-        resp = requests.post(
+        resp = get_ollama_session().post(
             get_ollama_url(),
             json={
-                "model": get_ollama_model(),
+                "model": model,
                 "prompt": prompt,
                 "system": system,
                 "stream": False,
                 "options": {"temperature": 0.0, "num_predict": 100},
             },
-            timeout=timeout,
+            timeout=ollama_timeout(timeout),
         )
         resp.raise_for_status()
-        return resp.json().get("response", "").strip()
+        text = resp.json().get("response", "").strip()
     except requests.RequestException as e:
         logger.warning("LLM_RESPONSE ollama call failed: %s", e)
         return None
+    if text:
+        if len(_reply_cache) >= _CACHE_MAX_ENTRIES:
+            _reply_cache.clear()
+        _reply_cache[cache_key] = text
+    return text
+
+
+def clear_reply_cache() -> None:
+    """Clear in-memory LLM reply cache (e.g. for tests)."""
+    _reply_cache.clear()
+
+
+def _stream_ollama(system: str, prompt: str, timeout: int = LLM_RESPONSE_TIMEOUT) -> Iterator[str]:
+    """Stream Ollama response text as it decodes. Yields nothing when disabled or on failure."""
+    if not llm_enabled():
+        return
+    started = False
+    try:
+        with get_ollama_session().post(
+            get_ollama_url(),
+            json={
+                "model": get_ollama_model(),
+                "prompt": prompt,
+                "system": system,
+                "stream": True,
+                "options": {"temperature": 0.0, "num_predict": 100},
+            },
+            timeout=ollama_timeout(timeout),
+            stream=True,
+        ) as resp:
+            resp.raise_for_status()
+            for line in resp.iter_lines():
+                if not line:
+                    continue
+                try:
+                    chunk = json.loads(line)
+                except ValueError:
+                    continue
+                piece = chunk.get("response") or ""
+                if not started:
+                    # Match _call_ollama's .strip(): no leading whitespace on the reply.
+                    piece = piece.lstrip()
+                if piece:
+                    started = True
+                    yield piece
+                if chunk.get("done"):
+                    break
+    except requests.RequestException as e:
+        logger.warning("LLM_RESPONSE ollama stream failed: %s", e)
 
 
 def llm_compose_greeting(profile: Any = None) -> Optional[str]:
@@ -102,8 +165,7 @@ def llm_compose_profile_update(
     return _call_ollama(_RESPONSE_SYSTEM_PROMPT, prompt)
 
 
-def llm_compose_general(query: str, profile: Any = None) -> Optional[str]:
-    """Use LLM for general questions / conversational responses."""
+def _general_prompt(query: str, profile: Any = None) -> str:
     diet = ""
     if profile and hasattr(profile, "dietary_preference"):
         diet = profile.dietary_preference or ""
@@ -114,7 +176,17 @@ def llm_compose_general(query: str, profile: Any = None) -> Optional[str]:
         f"If they didn't ask about specific ingredients, gently guide them to ask about specific ingredients so you can check safety. "
         f"Keep it to 2-3 sentences. Do NOT offer to brainstorm, suggest recipes, or suggest alternative ingredients."
     )
-    return _call_ollama(_RESPONSE_SYSTEM_PROMPT, prompt)
+    return prompt
+
+
+def llm_compose_general(query: str, profile: Any = None) -> Optional[str]:
+    """Use LLM for general questions / conversational responses."""
+    return _call_ollama(_RESPONSE_SYSTEM_PROMPT, _general_prompt(query, profile))
+
+
+def llm_stream_general(query: str, profile: Any = None) -> Iterator[str]:
+    """Streaming variant of llm_compose_general: yields reply text as Ollama decodes it."""
+    return _stream_ollama(_RESPONSE_SYSTEM_PROMPT, _general_prompt(query, profile))
 
 
 def _looks_like_ingredient_list(text: str) -> bool:
@@ -162,6 +234,7 @@ _ABSOLUTE_SAFETY_CLAIM_PATTERNS = (
     r"certified\s+safe",
     r"medically\s+(?:safe|certified|approved)",
 )
+_ABSOLUTE_SAFETY_CLAIM_RE = re.compile("|".join(_ABSOLUTE_SAFETY_CLAIM_PATTERNS))
 
 
 def _explanation_makes_absolute_safety_claim(text: str) -> bool:
@@ -170,8 +243,7 @@ def _explanation_makes_absolute_safety_claim(text: str) -> bool:
     never as a blanket "safe to eat" claim (Phase 3 product-honesty)."""
     if not text:
         return False
-    lowered = text.lower()
-    return any(re.search(p, lowered) for p in _ABSOLUTE_SAFETY_CLAIM_PATTERNS)
+    return _ABSOLUTE_SAFETY_CLAIM_RE.search(text.lower()) is not None
 
 
 def _explanation_species_mismatch(text: str, flagged: List[str]) -> bool:
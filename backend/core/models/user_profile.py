@@ -5,7 +5,7 @@ allergens, lifestyle are separate lists.
 Updates merge without overwriting existing fields (partial updates).
 Canonical options loaded from data/profile_options.json (single source of truth).
 """
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import List, Optional
 
 from core.profile_options import (
@@ -59,7 +59,22 @@ class UserProfile:
             self.lifestyle = list(lifestyle)
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Built directly rather than via dataclasses.asdict, which deep-copies
+        # recursively; the lists only hold strings, so fresh shallow lists suffice.
+        return {
+            "user_id": self.user_id,
+            "dietary_preference": self.dietary_preference,
+            "allergens": list(self.allergens),
+            "lifestyle": list(self.lifestyle),
+        }
+
+    def to_context_dict(self) -> dict:
+        """Profile fields passed to the compliance engine as profile_context (no user_id)."""
+        return {
+            "dietary_preference": self.dietary_preference,
+            "allergens": self.allergens,
+            "lifestyle": self.lifestyle,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "UserProfile":
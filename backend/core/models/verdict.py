@@ -12,7 +12,7 @@ class VerdictStatus(str, Enum):
     UNCERTAIN = "UNCERTAIN"
 
 
-@dataclass
+@dataclass(slots=True)
 class ComplianceVerdict:
     status: VerdictStatus
     triggered_restrictions: list[str] = field(default_factory=list)
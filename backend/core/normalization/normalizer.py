@@ -6,6 +6,7 @@ Unicode NFKC normalization for regional scripts (e.g. Devanagari, Tamil) and com
 import re
 import logging
 import unicodedata
+from functools import lru_cache
 from typing import List, Optional
 
 logger = logging.getLogger(__name__)
@@ -169,6 +170,26 @@ KNOWN_VARIANTS: dict[str, str] = {
     "animal rennet": "rennet",
 }
 # OCR typos merge into KNOWN_VARIANTS at lookup time (not duplicated in dict literal).
+# Built once: one dict probe per key instead of two. OCR fixes win on collision.
+_VARIANT_LOOKUP: dict[str, str] = {**KNOWN_VARIANTS, **OCR_TYPOS}
+
+# Single-pass character table for normalize_ingredient_key: drop markers and
+# apostrophes (M8 orthography), turn list punctuation and dashes into spaces.
+_KEY_CHAR_TABLE = str.maketrans(
+    {
+        "*": None,
+        ".": None,
+        "'": None,
+        "\u2019": None,
+        "\u2018": None,
+        ",": " ",
+        ";": " ",
+        ":": " ",
+        "-": " ",
+        "\u2013": " ",
+        "\u2014": " ",
+    }
+)
 
 _E_NUMBER_RE = re.compile(r"^e(\d{3,4})([a-z]?)$", re.IGNORECASE)
 # EU food additive codes are E100–E1599 (optional letter suffix a–f).
@@ -180,7 +201,7 @@ def parse_e_number(text: str) -> Optional[tuple[int, str]]:
     """Parse E-number into (numeric code, suffix letter). None if not E-number shaped."""
     if not text or not isinstance(text, str):
         return None
-    compact = re.sub(r"\s+", "", text.strip())
+    compact = "".join(text.split())
     m = _E_NUMBER_RE.match(compact)
     if not m:
         return None
@@ -210,17 +231,13 @@ def substance_key(text: str) -> str:
 
 
 def _apply_known_variants(t: str) -> str:
-    if t in OCR_TYPOS:
-        canonical = OCR_TYPOS[t]
-        if canonical != t:
-            logger.debug("NORMALIZE ocr typo applied raw=%s -> canonical=%s", t, canonical)
-        return canonical
-    if t in KNOWN_VARIANTS:
-        canonical = KNOWN_VARIANTS[t]
-        if canonical != t:
-            logger.debug("NORMALIZE variant applied raw=%s -> canonical=%s", t, canonical)
-        return canonical
-    return t
+    canonical = _VARIANT_LOOKUP.get(t)
+    if canonical is None:
+        return t
+    if canonical != t:
+        kind = "ocr typo" if t in OCR_TYPOS else "variant"
+        logger.debug("NORMALIZE %s applied raw=%s -> canonical=%s", kind, t, canonical)
+    return canonical
 
 
 def _apply_regional_canonical(t: str) -> str:
@@ -246,13 +263,18 @@ def normalize_ingredient_key(text: str, *, apply_regional: bool = True) -> str:
     """
     if not text or not isinstance(text, str):
         return ""
-    t = unicodedata.normalize("NFKC", text).lower().strip()
-    t = t.replace("*", "").replace(".", "")
+    return _normalize_ingredient_key_cached(text, apply_regional)
+
+
+# Every layer (resolution cache key, Tier 1/2 lookups, substance keys) re-normalizes
+# the same handful of pantry strings. The inputs are all static tables loaded once
+# per process, so results are memoized; cache_info() reports the hit ratio.
+@lru_cache(maxsize=4096)
+def _normalize_ingredient_key_cached(text: str, apply_regional: bool) -> str:
+    t = unicodedata.normalize("NFKC", text).lower()
     # M8 orthography: possessive / curly apostrophes must not block alias hits.
-    t = t.replace("'", "").replace("\u2019", "").replace("\u2018", "")
-    t = re.sub(r"[,;:\-\u2013\u2014]+", " ", t)
-    t = re.sub(r"\s+", " ", t)
-    t = t.strip()
+    t = t.translate(_KEY_CHAR_TABLE)
+    t = " ".join(t.split())
     t = _apply_known_variants(t)
     if not apply_regional:
         return t
@@ -269,4 +291,5 @@ def tokenize_ingredients(raw_text: str) -> List[str]:
         return []
     # Split on comma, newline, semicolon; trim each
     parts = re.split(r"[\n,;]", raw_text)
-    return [normalize_ingredient_key(p) for p in parts if normalize_ingredient_key(p)]
+    keys = (normalize_ingredient_key(p) for p in parts)
+    return [k for k in keys if k]
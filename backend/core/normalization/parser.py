@@ -2,7 +2,8 @@
 Flatten ingredient strings for evaluation: split parentheses, commas, map processed foods to base ingredients.
 """
 import logging
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
 from core.normalization.normalizer import normalize_ingredient_key
 from core.parsing.ingredient_parser import (
@@ -131,14 +132,21 @@ def flatten_ingredients(raw_str: str) -> List[str]:
     """
     if not raw_str or not isinstance(raw_str, str):
         return []
+    return list(_flatten_ingredients_cached(raw_str))
+
+
+# Chat preprocessing and label decomposition flatten the same pantry strings on
+# every turn; like normalize_ingredient_key, this reads only static tables.
+@lru_cache(maxsize=4096)
+def _flatten_ingredients_cached(raw_str: str) -> Tuple[str, ...]:
     raw_str = strip_label_boilerplate(raw_str)
     if not raw_str:
-        return []
+        return ()
 
     # Check processed food first (whole string normalized)
     key = normalize_ingredient_key(raw_str)
     if key in PROCESSED_FOOD_TO_BASE:
-        return list(PROCESSED_FOOD_TO_BASE[key])
+        return tuple(PROCESSED_FOOD_TO_BASE[key])
 
     flat: List[str] = []
     for clause in _label_clauses(raw_str):
@@ -169,4 +177,4 @@ def flatten_ingredients(raw_str: str) -> List[str]:
         if item and item not in seen:
             seen.add(item)
             result.append(item)
-    return result
+    return tuple(result)
@@ -53,11 +53,12 @@ def _register_ingredient(by_key: dict[str, Ingredient], ing: Ingredient) -> None
 
 
 # Words that indicate a string is a sentence/question, not an ingredient name
-_SENTENCE_VERBS = {"eat", "can", "have", "does", "allow", "permit", "is", "are", "do", "will",
-                   "should", "could", "would", "may", "might", "shall", "make", "tell", "check",
-                   "know", "find", "safe", "ok", "okay"}
-_DIET_WORDS = {"jain", "vegan", "vegetarian", "halal", "kosher", "hindu", "pescatarian",
-               "lacto", "ovo", "sikh", "buddhist"}
+_SENTENCE_VERBS = frozenset({"eat", "can", "have", "does", "allow", "permit", "is", "are", "do", "will",
+                             "should", "could", "would", "may", "might", "shall", "make", "tell", "check",
+                             "know", "find", "safe", "ok", "okay"})
+_DIET_WORDS = frozenset({"jain", "vegan", "vegetarian", "halal", "kosher", "hindu", "pescatarian",
+                         "lacto", "ovo", "sikh", "buddhist"})
+_INPUT_STOPWORDS = _SENTENCE_VERBS | {"i", "my", "me", "a", "the", "for", "to"}
 
 
 def _is_valid_ingredient_input(s: str) -> bool:
@@ -73,14 +74,13 @@ def _is_valid_ingredient_input(s: str) -> bool:
     if len(words) > 5:
         return False
     # If it contains sentence verbs + diet words together, it's a question
-    has_verb = any(w in _SENTENCE_VERBS for w in words)
-    has_diet = any(w in _DIET_WORDS for w in words)
-    if has_verb and has_diet:
+    if not _SENTENCE_VERBS.isdisjoint(words) and not _DIET_WORDS.isdisjoint(words):
         return False
     # If more than half the words are verbs/stopwords, reject
-    stopword_count = sum(1 for w in words if w in _SENTENCE_VERBS or w in {"i", "my", "me", "a", "the", "for", "to"})
-    if len(words) > 2 and stopword_count > len(words) / 2:
-        return False
+    if len(words) > 2:
+        stopword_count = sum(1 for w in words if w in _INPUT_STOPWORDS)
+        if stopword_count > len(words) / 2:
+            return False
     return True
 
 
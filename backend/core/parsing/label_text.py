@@ -26,6 +26,10 @@ _OCR_PREFIX_FIXES = (
 )
 # OCR sometimes renders a comma as the letter "l" followed by a period.
 _BROKEN_COMMA = re.compile(r"\bl\s*\.\s+(?=[a-z])", re.IGNORECASE)
+_SPACE_BEFORE_COMMA = re.compile(r"\s+,")
+_SPACE_AFTER_COMMA = re.compile(r",\s+")
+# Paragraph breaks or a sentence that starts the nutrition panel.
+_LABEL_SEGMENT_SPLIT = re.compile(r"\n{2,}|\.\s+(?=Nutrition\b)")
 
 
 def fix_ocr_label_noise(text: str) -> str:
@@ -36,8 +40,8 @@ def fix_ocr_label_noise(text: str) -> str:
     for pattern, replacement in _OCR_PREFIX_FIXES:
         t = pattern.sub(replacement, t)
     t = _BROKEN_COMMA.sub(", ", t)
-    t = re.sub(r"\s+,", ",", t)
-    t = re.sub(r",\s+", ", ", t)
+    t = _SPACE_BEFORE_COMMA.sub(",", t)
+    t = _SPACE_AFTER_COMMA.sub(", ", t)
     return t
 
 
@@ -83,7 +87,7 @@ def select_ingredient_label_text(text: str) -> str:
     elif len(headers) == 1:
         t = t[headers[0].start() :].strip()
     else:
-        segments = [s.strip() for s in re.split(r"\n{2,}|\.\s+(?=Nutrition\b)", t) if s.strip()]
+        segments = [s.strip() for s in _LABEL_SEGMENT_SPLIT.split(t) if s.strip()]
         if segments:
             best = max(segments, key=_segment_comma_count)
             if _segment_comma_count(best) > 0:
@@ -18,7 +18,7 @@ from pathlib import Path
 from typing import Any, Optional
 
 from core.models.user_profile import UserProfile
-from core.config import redact_pii
+from core.config import redact_pii, write_text_atomic
 
 logger = logging.getLogger(__name__)
 
@@ -54,9 +54,7 @@ def _load_all() -> dict:
 
 
 def _save_all(data: dict) -> None:
-    _PROFILES_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(_PROFILES_PATH, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    write_text_atomic(_PROFILES_PATH, json.dumps(data, indent=2))
 
 
 def get_profile(user_id: str, org_id: Optional[str] = None) -> Optional[UserProfile]:
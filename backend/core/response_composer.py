@@ -7,6 +7,8 @@ import logging
 import re
 from typing import List, Optional, Dict, Any, Set
 
+from core.external_apis.enrichment_relevance import is_enrichment_relevant
+from core.bridge import ALLERGEN_TO_RESTRICTION_ID
 from core.knowledge.ike2 import truth_anchor
 from core.knowledge.ike2.stores import local_ontology
 from core.models.verdict import ComplianceVerdict, VerdictStatus
@@ -200,7 +202,6 @@ def format_audit_item_name(user_input: str, canonical: str) -> str:
     if is_e_number_code(raw) and canon and user_label.lower() != canon_label.lower():
         return f"{user_label} · {canon_label}"
 
-    from core.external_apis.enrichment_relevance import is_enrichment_relevant
     if canon and not is_enrichment_relevant(raw, canon):
         return user_label
 
@@ -273,8 +274,6 @@ def _profile_allergen_restriction_ids(profile: Any) -> Set[str]:
     Milk/egg/wheat allergens map to dairy_free/egg_free/gluten_free (no ``_allergy``
     suffix). Without this set, those FAILs would be stamped as diet chips on cards.
     """
-    from core.bridge import ALLERGEN_TO_RESTRICTION_ID
-
     out: Set[str] = set()
     for a in getattr(profile, "allergens", None) or []:
         key = (str(a) or "").lower().strip().replace(" ", "_").replace("-", "_")
@@ -411,12 +410,27 @@ def _restriction_label(restriction_id: str) -> str:
     return _RESTRICTION_DISPLAY.get(restriction_id, restriction_id.replace("_", " "))
 
 
+# "-es" plurals only after these endings (tomatoes, peaches, glasses); "oranges"
+# and "sauces" just drop the "s".
+_ES_PLURAL_STEMS = ("o", "s", "x", "z", "ch", "sh")
+
+# Known words resolved by lookup: singular-with-s nouns map to themselves,
+# plurals of INGREDIENT_REASONS keys to their key.
+_MATCH_SINGULAR: Dict[str, str] = {
+    **{k + "s": k for k in INGREDIENT_REASONS if not k.endswith("s")},
+    **{w: w for w in _SINGULAR_S_WORDS | {"isinglass", "octopus", "citrus"}},
+}
+
+
 def _normalize_for_match(s: str) -> str:
-    """Normalize ingredient name for matching: lowercase, strip trailing s/es."""
+    """Normalize ingredient name for matching: lowercase, strip a plural s/es."""
     s = s.lower().strip()
-    if s.endswith("es") and len(s) > 3:
+    hit = _MATCH_SINGULAR.get(s)
+    if hit is not None:
+        return hit
+    if s.endswith("es") and len(s) > 3 and s[:-2].endswith(_ES_PLURAL_STEMS):
         return s[:-2]
-    if s.endswith("s") and len(s) > 2:
+    if s.endswith("s") and len(s) > 2 and not s.endswith(("ss", "us")):
         return s[:-1]
     return s
 
@@ -1,8 +1,9 @@
 """
 Loads restrictions from data/restrictions.json. Evaluates ingredient against rules only.
 """
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, List, Optional, Sequence
 import json
 import logging
 
@@ -15,9 +16,14 @@ logger = logging.getLogger(__name__)
 _DEFAULT_RESTRICTIONS_PATH = get_restrictions_path()
 
 
+@lru_cache(maxsize=None)
+def _is_property_field(field: str) -> bool:
+    return isinstance(getattr(Ingredient, field, None), property)
+
+
 def _get_ingredient_value(ing: Ingredient, field: str) -> Any:
     """Get field value from Ingredient for rule evaluation (including properties)."""
-    if hasattr(Ingredient, field) and isinstance(getattr(Ingredient, field), property):
+    if _is_property_field(field):
         return getattr(ing, field)
     if hasattr(ing, field):
         return getattr(ing, field)
@@ -57,10 +63,23 @@ def _evaluate_rule(ing: Ingredient, rule: Rule) -> bool:
     return False
 
 
+def _rule_outcomes(restriction: Restriction) -> list[tuple[Rule, tuple[str, str]]]:
+    """Pair each rule with its (action, reason) result; the reason depends only on the rule."""
+    return [
+        (rule, (rule.action.value, f"{restriction.id}: {rule.field} {rule.operator} {rule.value}"))
+        for rule in restriction.rules
+    ]
+
+
+# Results are shared immutable tuples, so evaluating allocates nothing per call.
+_PASS: tuple[str, Optional[str]] = ("PASS", None)
+
+
 class RestrictionRegistry:
     def __init__(self, restrictions_path: Optional[Path] = None):
         self._path = restrictions_path or _DEFAULT_RESTRICTIONS_PATH
         self._by_id: dict[str, Restriction] = {}
+        self._outcomes: dict[str, list[tuple[Rule, tuple[str, str]]]] = {}
         self._load()
 
     def _load(self) -> None:
@@ -72,6 +91,7 @@ class RestrictionRegistry:
         for item in data.get("restrictions", []):
             r = Restriction.from_dict(item)
             self._by_id[r.id] = r
+            self._outcomes[r.id] = _rule_outcomes(r)
         logger.info("Loaded %d restrictions from %s", len(self._by_id), self._path)
 
     def get(self, restriction_id: str) -> Optional[Restriction]:
@@ -80,12 +100,36 @@ class RestrictionRegistry:
     def list_ids(self) -> list[str]:
         return list(self._by_id.keys())
 
+    def _outcomes_for(self, restriction: Restriction) -> list[tuple[Rule, tuple[str, str]]]:
+        if self._by_id.get(restriction.id) is restriction:
+            return self._outcomes[restriction.id]
+        return _rule_outcomes(restriction)
+
     def evaluate(self, ingredient: Ingredient, restriction: Restriction) -> tuple[str, Optional[str]]:
         """
         Evaluate one ingredient against one restriction.
         Returns ("FAIL", reason) or ("WARN", reason) or ("PASS", None).
         """
-        for rule in restriction.rules:
+        for rule, outcome in self._outcomes_for(restriction):
             if _evaluate_rule(ingredient, rule):
-                return (rule.action.value, f"{restriction.id}: {rule.field} {rule.operator} {rule.value}")
-        return ("PASS", None)
+                return outcome
+        return _PASS
+
+    def evaluate_many(
+        self, ingredients: Sequence[Ingredient], restriction: Restriction
+    ) -> List[tuple[str, Optional[str]]]:
+        """
+        Evaluate a list of ingredients against one restriction, in order.
+        Same results as calling ``evaluate`` per ingredient, in one sweep.
+        """
+        outcomes = self._outcomes_for(restriction)
+        results: List[tuple[str, Optional[str]]] = []
+        append = results.append
+        for ingredient in ingredients:
+            for rule, outcome in outcomes:
+                if _evaluate_rule(ingredient, rule):
+                    append(outcome)
+                    break
+            else:
+                append(_PASS)
+        return results
@@ -14,6 +14,7 @@ Run from repo root or backend: python backend/scripts/check_external_apis.py
 Exit 0 if at least one API works; 1 if all fail or none configured.
 """
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Tuple
 
@@ -101,22 +102,18 @@ def main() -> int:
     print("Checking all 5 external enrichment APIs...")
     print("  (Order used for unknown ingredients: USDA → Open Food Facts → PubChem → ChEBI → Wikidata)\n")
 
-    results = []
-    # 1. USDA FDC
-    ok, msg = check_usda(usda_key)
-    results.append(("USDA FDC", ok, msg))
-    # 2. Open Food Facts
-    ok, msg = check_open_food_facts()
-    results.append(("Open Food Facts", ok, msg))
-    # 3. PubChem
-    ok, msg = check_pubchem()
-    results.append(("PubChem", ok, msg))
-    # 4. ChEBI
-    ok, msg = check_chebi()
-    results.append(("ChEBI", ok, msg))
-    # 5. Wikidata
-    ok, msg = check_wikidata()
-    results.append(("Wikidata", ok, msg))
+    checks = [
+        ("USDA FDC", lambda: check_usda(usda_key)),
+        ("Open Food Facts", check_open_food_facts),
+        ("PubChem", check_pubchem),
+        ("ChEBI", check_chebi),
+        ("Wikidata", check_wikidata),
+    ]
+    # Probes are independent network calls: run them together so the check takes
+    # as long as the slowest API, not the sum of all five timeouts.
+    with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+        futures = [(name, pool.submit(check)) for name, check in checks]
+        results = [(name, *future.result()) for name, future in futures]
 
     for name, ok, msg in results:
         status = "OK" if ok else "FAIL"
@@ -19,10 +19,15 @@ def main():
     print(f"Ontology version: {data.get('ontology_version', 'unknown')}")
     print(f"Total ingredients: {len(ingredients)}")
 
-    # Count by origin type
-    animal = sum(1 for i in ingredients if i.get("animal_origin"))
-    plant = sum(1 for i in ingredients if i.get("plant_origin"))
-    synthetic = sum(1 for i in ingredients if i.get("synthetic"))
+    # Count by origin type (single pass over the ingredient list)
+    animal = plant = synthetic = 0
+    for i in ingredients:
+        if i.get("animal_origin"):
+            animal += 1
+        if i.get("plant_origin"):
+            plant += 1
+        if i.get("synthetic"):
+            synthetic += 1
     print(f"  Animal-origin: {animal}")
     print(f"  Plant-origin:  {plant}")
     print(f"  Synthetic:     {synthetic}")
@@ -7,6 +7,7 @@ Usage: cd backend && python scripts/run_enrichment.py [--min-frequency 2] [--dry
 import argparse
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Ensure backend is on path
@@ -20,6 +21,7 @@ def main():
     parser = argparse.ArgumentParser(description="Enrich unknown ingredients from APIs into dynamic ontology")
     parser.add_argument("--min-frequency", type=int, default=1, help="Min times seen to consider for enrichment")
     parser.add_argument("--dry-run", action="store_true", help="Do not write to dynamic ontology")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent API lookups (writes stay serial)")
     args = parser.parse_args()
 
     from core.enrichment.unknown_log import get_unknown_log
@@ -34,11 +36,18 @@ def main():
         return 0
 
     logger.info("Enriching %d unknown ingredient keys (min_frequency=%s)", len(keys), args.min_frequency)
-    added = 0
-    for normalized_key in keys:
+
+    def lookup(normalized_key):
         raw = (entries.get(normalized_key) or {}).get("raw_inputs") or [normalized_key]
         raw_input = raw[0] if raw else normalized_key
-        result = enrich_unknown_ingredient(raw_input, normalized_key, use_cache=True)
+        return enrich_unknown_ingredient(raw_input, normalized_key, use_cache=True)
+
+    # Lookups are network-bound and independent, so they fan out; appends to the
+    # dynamic ontology file happen here, one at a time, in key order.
+    added = 0
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        results = list(pool.map(lookup, keys))
+    for result in results:
         if result.ingredient is None or result.confidence != "high":
             continue
         if not args.dry_run:
@@ -215,6 +215,11 @@ def seed_from_ontology(
         batch = ingredients[batch_start : batch_start + batch_size]
         batch_end = min(batch_start + batch_size, total)
 
+        # Alias rows for the whole batch go out in one insert at the end of the
+        # batch instead of one round-trip per alias.
+        alias_rows: list[dict[str, Any]] = []
+        batch_aliases: set[str] = set()
+
         for item in batch:
             canonical_name = item.get("canonical_name") or item.get("id")
             if not canonical_name:
@@ -287,22 +292,34 @@ def seed_from_ontology(
                     norm_alias = normalize_ingredient_key(alias)
                     if not norm_alias:
                         continue
-                    if norm_alias in existing_aliases:
+                    if norm_alias in existing_aliases or norm_alias in batch_aliases:
                         continue
-                    alias_payload = {
+                    alias_rows.append({
                         "alias": alias,
                         "normalized_alias": norm_alias,
                         "ingredient_id": ingredient_id,
                         "alias_type": "canonical" if alias == canonical_name else "synonym",
                         "language": "en",
-                    }
-                    supabase.table("ingredient_aliases").insert(alias_payload).execute()
-                    existing_aliases.add(norm_alias)
-                    aliases_inserted += 1
+                    })
+                    batch_aliases.add(norm_alias)
 
             except Exception as exc:  # noqa: BLE001 — collect and continue batch seeding
                 errors.append(f"{canonical_name}: {exc}")
 
+        if alias_rows:
+            try:
+                supabase.table("ingredient_aliases").insert(alias_rows).execute()
+                existing_aliases.update(batch_aliases)
+                aliases_inserted += len(alias_rows)
+            except Exception:  # noqa: BLE001 — one conflicting alias fails the batch; retry per row
+                for alias_payload in alias_rows:
+                    try:
+                        supabase.table("ingredient_aliases").insert(alias_payload).execute()
+                        existing_aliases.add(alias_payload["normalized_alias"])
+                        aliases_inserted += 1
+                    except Exception as exc:  # noqa: BLE001 — collect and continue batch seeding
+                        errors.append(f"alias {alias_payload['normalized_alias']}: {exc}")
+
         done = batch_end
         if dry_run:
             print(f"Batch complete: {done}/{total} ({done / total * 100:.1f}%)")
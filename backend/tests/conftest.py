@@ -0,0 +1,21 @@
+"""
+Suite-wide setup: load backend/.env once so every test module sees the same
+settings (imports resolve via pythonpath in pytest.ini), and start each test
+with empty rate-limit buckets.
+"""
+from pathlib import Path
+
+import pytest
+from dotenv import load_dotenv
+
+load_dotenv(Path(__file__).resolve().parents[1] / ".env")
+
+from core.security.rate_limit import limiter  # noqa: E402  (after .env so RATE_LIMIT_* apply)
+
+
+@pytest.fixture(autouse=True)
+def _reset_rate_limits():
+    """TestClient requests all share one client IP, so a fast suite would otherwise
+    exhaust the per-minute chat limit and get 429s depending on test order."""
+    if limiter is not None:
+        limiter.reset()
@@ -1,10 +1,6 @@
 import os
-from pathlib import Path
 
 import pytest
-from dotenv import load_dotenv
-
-load_dotenv(Path(__file__).resolve().parents[2] / ".env")
 
 
 def _is_local(url: str) -> bool:
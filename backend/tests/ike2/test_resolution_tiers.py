@@ -105,3 +105,20 @@ def test_tier2_local_ontology_hit_is_trusted_without_db(monkeypatch):
     assert r.status == "resolved"
     assert r.trusted is True
     assert r.resolution_layer == "L2_local_ontology"
+
+
+def test_warm_up_builds_tier2_index_without_network(monkeypatch):
+    """Startup warm-up seeds Tier 1 and the Tier-2 index, never touching Tier 3."""
+    import core.knowledge.ike2.stores.db as db
+    from core.knowledge.ike2.stores import local_ontology
+
+    def _raise(*_a, **_k):
+        raise AssertionError("warm-up must not hit Supabase")
+
+    monkeypatch.setattr(db, "resolve_alias", _raise)
+    monkeypatch.setattr(db, "disambiguate", _raise)
+    local_ontology.reset_cache()
+    resolver.warm_up()
+
+    assert local_ontology._INDEX is not None
+    assert resolution_cache.get(resolution_cache.cache_key("sugar", None)) is not None
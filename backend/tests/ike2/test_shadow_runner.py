@@ -1,7 +1,9 @@
 from types import SimpleNamespace
 
+from core.knowledge import ontology_cache
 from core.knowledge.ike2.shadow import runner
 from core.knowledge.ike2.shadow.runner import run_legacy_diff
+from core.knowledge.ontology_cache import OntologyBoundCache
 
 
 def test_run_legacy_diff_runs_without_mode_gate(monkeypatch):
@@ -87,14 +89,14 @@ def test_swallows_interpreter_shutdown_runtime_error(monkeypatch):
 
 
 def test_log_diff_skips_during_interpreter_finalization(monkeypatch):
-    import core.knowledge.ingredient_db as ingredient_db
+    from core.knowledge.ike2.stores import db
 
     monkeypatch.setattr(runner, "_interpreter_finalizing", lambda: True)
 
     def _boom():
         raise AssertionError("supabase client should not be created during finalization")
 
-    monkeypatch.setattr(ingredient_db, "get_supabase_config", _boom)
+    monkeypatch.setattr(db, "get_client", _boom)
     runner._log_diff(
         {
             "raw_input": "x",
@@ -106,6 +108,37 @@ def test_log_diff_skips_during_interpreter_finalization(monkeypatch):
     )
 
 
+def test_log_diff_reuses_shared_supabase_client(monkeypatch):
+    import supabase
+
+    from core.knowledge.ike2.stores import db
+
+    inserted = []
+
+    class _Table:
+        def insert(self, row):
+            inserted.append(row)
+            return SimpleNamespace(execute=lambda: None)
+
+    def _no_new_client(*a, **k):
+        raise AssertionError("shadow diff logging should reuse the shared client")
+
+    monkeypatch.setattr(runner, "_interpreter_finalizing", lambda: False)
+    monkeypatch.setattr(db, "get_supabase_config", lambda: SimpleNamespace(url="u", key="k"))
+    monkeypatch.setattr(db, "_client", SimpleNamespace(table=lambda name: _Table()))
+    monkeypatch.setattr(supabase, "create_client", _no_new_client)
+    diff = {
+        "raw_input": "x",
+        "legacy_verdict": "UNCERTAIN",
+        "ike2_verdict": "SAFE",
+        "match": False,
+        "false_safe_regression": False,
+    }
+    runner._log_diff(diff)
+    runner._log_diff(diff)
+    assert len(inserted) == 2
+
+
 def test_real_pipeline_e471_vegan_not_safe():
     verdict = runner.ike2_external_verdict(["E471"], ["vegan"], None)
     assert verdict != "SAFE"
@@ -156,3 +189,16 @@ def test_legacy_external_verdict_uses_compliance_engine_directly(monkeypatch):
     assert verdict == "NOT_SAFE"
     assert len(calls) == 1
     assert calls[0][1].get("use_api_fallback") is False
+
+
+def test_legacy_engine_is_shared_until_ontology_changes(monkeypatch):
+    """The diff path must not re-parse the ontology on every chat turn."""
+    monkeypatch.setattr(runner, "_legacy_engine", OntologyBoundCache(runner._build_legacy_engine))
+    stamp = [(1, 1)]
+    monkeypatch.setattr(ontology_cache, "ontology_stamp", lambda: stamp[0])
+
+    first = runner._get_legacy_engine()
+    assert runner._get_legacy_engine() is first
+
+    stamp[0] = (1, 2)  # dynamic ontology rewritten by enrichment
+    assert runner._get_legacy_engine() is not first
@@ -149,3 +149,15 @@ def test_triggered_without_input_mapping_still_excludes_alias():
     )
     assert _group_names(payload, "avoid") == ["Carmine"]
     assert _group_names(payload, "safe") == []
+
+
+def test_normalize_for_match_keeps_singular_s_words():
+    """Plural stripping must not clip singular nouns or leave orphaned stems."""
+    from core.response_composer import _normalize_for_match
+
+    assert _normalize_for_match("Molasses") == "molasses"
+    assert _normalize_for_match("isinglass") == "isinglass"
+    assert _normalize_for_match("octopus") == "octopus"
+    assert _normalize_for_match("eggs") == "egg"
+    assert _normalize_for_match("tomatoes") == "tomato"
+    assert _normalize_for_match("oranges") == _normalize_for_match("orange")
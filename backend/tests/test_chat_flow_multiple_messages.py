@@ -284,3 +284,71 @@ def test_flow_profile_update_slash_then_ingredient():
     )
     assert r2.status_code == 200
     assert _stream_has_tag(r2.text, INGREDIENT_AUDIT_TAG)
+
+
+def test_profile_update_streams_before_llm_explanation(monkeypatch, tmp_path):
+    """A diet change in the same message reaches the client before the (slow) LLM card text."""
+    import app as app_module
+    from core import profile_storage
+
+    monkeypatch.setattr(profile_storage, "_PROFILES_PATH", tmp_path / "profiles.json")
+
+    events = []
+    real_profile_tail = app_module._profile_tail
+
+    def recording_profile_tail(profile_state):
+        events.append("profile")
+        return real_profile_tail(profile_state)
+
+    def fake_explanation(**_kwargs):
+        events.append("llm")
+        return "LLM explanation."
+
+    monkeypatch.setattr(app_module, "llm_enabled", lambda: True)
+    monkeypatch.setattr(app_module, "llm_compose_verdict_explanation", fake_explanation)
+    monkeypatch.setattr(app_module, "_profile_tail", recording_profile_tail)
+
+    client = TestClient(app_module.app)
+    r = client.post(
+        "/chat/grocery",
+        json={"query": "I am vegan. Is milk safe?", "user_id": "flow-profile-before-llm"},
+    )
+    assert r.status_code == 200, r.text[:300]
+    # The profile chunk is serialized once and streamed ahead of the LLM card text.
+    assert events == ["profile", "llm"]
+    assert r.text.count(PROFILE_UPDATE_TAG) == 2
+    assert r.text.find(PROFILE_UPDATE_TAG) < r.text.find(INGREDIENT_AUDIT_TAG)
+    assert _extract_audit_payload(r.text) is not None
+
+
+def test_restated_diet_does_not_rewrite_profile_store(monkeypatch, tmp_path):
+    """Saying "I am vegan" again keeps the confirmation but skips the profile-store rewrite."""
+    import app as app_module
+    from core import profile_storage
+
+    monkeypatch.setattr(profile_storage, "_PROFILES_PATH", tmp_path / "profiles.json")
+
+    saves = []
+    real_save = app_module.save_profile
+    monkeypatch.setattr(
+        app_module, "save_profile", lambda p, *a, **k: saves.append(p.dietary_preference) or real_save(p, *a, **k)
+    )
+    client = TestClient(app_module.app)
+    for _ in range(2):
+        r = client.post(
+            "/chat/grocery",
+            json={"query": "I am vegan", "user_id": "flow-restated-diet"},
+        )
+        assert r.status_code == 200, r.text[:300]
+        assert _stream_has_tag(r.text, PROFILE_UPDATE_TAG)
+    assert saves == ["Vegan"]
+
+
+def test_nl_allergen_merge_dedupes_case_insensitively():
+    from app import _apply_profile_updates
+    from core.models.user_profile import UserProfile
+
+    profile = UserProfile(user_id="merge-dedupe", allergens=["Peanuts"])
+    _apply_profile_updates(profile, {"allergens": ["peanuts", "soy", "Soy"], "lifestyle": ["no alcohol", "No Alcohol"]})
+    assert profile.allergens == ["Peanuts", "soy"]
+    assert profile.lifestyle == ["no alcohol"]
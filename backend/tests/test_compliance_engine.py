@@ -5,6 +5,20 @@ Run from backend: python -m pytest tests/test_compliance_engine.py -v
 import pytest
 
 
+@pytest.fixture(scope="module")
+def engine():
+    """One engine (ontology + restrictions loaded once) for the offline tests.
+
+    Tests that enable the mocked API fallback build their own engine, since a
+    successful enrichment adds ingredients to the registry.
+    """
+    from core.config import get_ontology_path
+    from core.evaluation.compliance_engine import ComplianceEngine
+    if not get_ontology_path().exists():
+        pytest.skip("ontology.json not found")
+    return ComplianceEngine()
+
+
 def test_ingredient_registry_resolve_static():
     """Ontology lookup: known ingredient resolves from static ontology."""
     from core.config import get_ontology_path
@@ -68,14 +82,9 @@ def test_confidence_uncertainty_penalty():
     assert conf < 0.7
 
 
-def test_compliance_engine_safe_vegan():
+def test_compliance_engine_safe_vegan(engine):
     """Engine returns SAFE when ingredients are vegan and restriction is vegan."""
-    from core.config import get_ontology_path
-    from core.evaluation.compliance_engine import ComplianceEngine
     from core.models.verdict import VerdictStatus
-    if not get_ontology_path().exists():
-        pytest.skip("ontology.json not found")
-    engine = ComplianceEngine()
     verdict = engine.evaluate(
         ["water", "sugar", "salt"],
         restriction_ids=["vegan"],
@@ -85,14 +94,9 @@ def test_compliance_engine_safe_vegan():
     assert verdict.confidence_score >= 0
 
 
-def test_compliance_engine_not_safe_vegan():
+def test_compliance_engine_not_safe_vegan(engine):
     """Engine returns NOT_SAFE when dairy/meat and restriction is vegan."""
-    from core.config import get_ontology_path
-    from core.evaluation.compliance_engine import ComplianceEngine
     from core.models.verdict import VerdictStatus
-    if not get_ontology_path().exists():
-        pytest.skip("ontology.json not found")
-    engine = ComplianceEngine()
     verdict = engine.evaluate(
         ["milk", "sugar"],
         restriction_ids=["vegan"],
@@ -118,15 +122,10 @@ def test_compliance_engine_user_profile_restriction_ids():
     assert "vegan" in ids
 
 
-def test_trace_ingredient_informational():
+def test_trace_ingredient_informational(engine):
     """Trace (<2%) unknown ingredients do not force UNCERTAIN when in trace set."""
-    from core.config import get_ontology_path
-    from core.evaluation.compliance_engine import ComplianceEngine
     from core.models.verdict import VerdictStatus
     from core.normalization.normalizer import normalize_ingredient_key
-    if not get_ontology_path().exists():
-        pytest.skip("ontology.json not found")
-    engine = ComplianceEngine()
     # Known ingredients + one unknown that is in trace set
     trace_key = normalize_ingredient_key("trace flavor xyznonexistent")
     verdict = engine.evaluate(
@@ -139,14 +138,9 @@ def test_trace_ingredient_informational():
     assert verdict.status in (VerdictStatus.SAFE, VerdictStatus.UNCERTAIN)
 
 
-def test_minor_ingredient_does_not_reduce_confidence():
+def test_minor_ingredient_does_not_reduce_confidence(engine):
     """Minor (<2%) ingredients are informational_only; resolution_level high so confidence not reduced."""
-    from core.config import get_ontology_path
-    from core.evaluation.compliance_engine import ComplianceEngine
     from core.normalization.normalizer import normalize_ingredient_key
-    if not get_ontology_path().exists():
-        pytest.skip("ontology.json not found")
-    engine = ComplianceEngine()
     trace_key = normalize_ingredient_key("minor unknown xyz")
     verdict_with_trace = engine.evaluate(
         ["water", "sugar", "minor unknown xyz"],
@@ -187,15 +181,10 @@ def test_api_failed_ingredient_uncertain_low_confidence():
         assert 0.0 <= verdict.confidence_score <= 0.4
 
 
-def test_minor_ingredient_violation_confidence_band():
+def test_minor_ingredient_violation_confidence_band(engine):
     """When only minor (<2%) ingredients trigger: NOT_SAFE, confidence 0.2-0.5."""
-    from core.config import get_ontology_path
-    from core.evaluation.compliance_engine import ComplianceEngine
     from core.models.verdict import VerdictStatus
     from core.normalization.normalizer import normalize_ingredient_key
-    if not get_ontology_path().exists():
-        pytest.skip("ontology.json not found")
-    engine = ComplianceEngine()
     # Milk is vegan violation; mark it as trace so only minor triggers
     trace_key = normalize_ingredient_key("milk")
     verdict = engine.evaluate(
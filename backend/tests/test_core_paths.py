@@ -90,3 +90,18 @@ def test_restriction_registry_loads_from_resolved_path():
     assert len(reg.list_ids()) > 0
     assert reg.get("vegan") is not None
     assert reg.get("no_onion") is not None
+
+
+def test_restriction_registry_evaluate_many_matches_evaluate():
+    """Batch evaluation returns the same per-ingredient results as evaluate()."""
+    from core.config import get_ontology_path, get_restrictions_path
+    from core.ontology.ingredient_registry import IngredientRegistry
+    from core.restrictions.restriction_registry import RestrictionRegistry
+    if not get_restrictions_path().exists() or not get_ontology_path().exists():
+        pytest.skip("ontology/restrictions data not found")
+    reg = RestrictionRegistry()
+    ings = [i for i in (IngredientRegistry().resolve(n) for n in ("milk", "sugar", "gelatin", "onion")) if i]
+    assert ings
+    for rid in ("vegan", "no_onion"):
+        rest = reg.get(rid)
+        assert reg.evaluate_many(ings, rest) == [reg.evaluate(i, rest) for i in ings]
@@ -3,118 +3,81 @@ Unit tests for enrichment: unknown log, dynamic ontology.
 Run from backend: python -m pytest tests/test_enrichment.py -v
 """
 import json
-import tempfile
 import pytest
-from pathlib import Path
 
+from core.enrichment.dynamic_ontology import DynamicOntology
+from core.enrichment.unknown_log import UnknownIngredientsLog
+from core.ontology.ingredient_schema import Ingredient
 
-def test_unknown_log_record_and_save():
-    """Unknown ingredients log records and persists."""
-    from core.enrichment.unknown_log import UnknownIngredientsLog
-    with tempfile.TemporaryDirectory() as tmp:
-        path = Path(tmp) / "unknowns.json"
-        log = UnknownIngredientsLog(path=path)
-        log.record("Wheat Flour", "wheat flour", restriction_ids=["vegan"], persist=True)
-        log.record("Wheat Flour", "wheat flour", persist=True)
-        entries = log.get_entries()
-        assert "wheat flour" in entries
-        assert entries["wheat flour"]["frequency"] == 2
-        assert path.exists()
-        data = json.loads(path.read_text())
-        assert "unknown_ingredients" in data
 
+@pytest.fixture
+def make_ingredient():
+    """Build a plain plant Ingredient; every other field keeps its schema default."""
+    def _make(**overrides):
+        return Ingredient(**{"plant_origin": True, **overrides})
+    return _make
 
-def test_unknown_log_keys_for_enrichment():
+
+def test_unknown_log_record_and_save(tmp_path):
+    """Unknown ingredients log records in memory; one persist writes the accumulated state."""
+    path = tmp_path / "unknowns.json"
+    log = UnknownIngredientsLog(path=path)
+    log.record("Wheat Flour", "wheat flour", restriction_ids=["vegan"], persist=False)
+    assert not path.exists()
+    log.record("Wheat Flour", "wheat flour", persist=True)
+    entries = log.get_entries()
+    assert "wheat flour" in entries
+    assert entries["wheat flour"]["frequency"] == 2
+    data = json.loads(path.read_text())
+    assert data["unknown_ingredients"]["wheat flour"]["frequency"] == 2
+    assert UnknownIngredientsLog(path=path).get_entries()["wheat flour"]["restriction_ids_sample"] == ["vegan"]
+
+
+def test_unknown_log_keys_for_enrichment(tmp_path):
     """get_keys_for_enrichment returns keys above min_frequency."""
-    from core.enrichment.unknown_log import UnknownIngredientsLog
-    with tempfile.TemporaryDirectory() as tmp:
-        path = Path(tmp) / "unknowns.json"
-        log = UnknownIngredientsLog(path=path)
-        log.record("a", "a", persist=True)
-        log.record("a", "a", persist=True)
-        log.record("b", "b", persist=True)
-        keys = log.get_keys_for_enrichment(min_frequency=2)
-        assert "a" in keys
-        assert "b" not in keys
+    log = UnknownIngredientsLog(path=tmp_path / "unknowns.json")
+    log.record("a", "a", persist=False)
+    log.record("a", "a", persist=False)
+    log.record("b", "b", persist=False)
+    keys = log.get_keys_for_enrichment(min_frequency=2)
+    assert "a" in keys
+    assert "b" not in keys
 
 
-def test_dynamic_ontology_append():
+def test_dynamic_ontology_append(tmp_path, make_ingredient):
     """Dynamic ontology appends ingredient with source/confidence."""
-    from core.enrichment.dynamic_ontology import DynamicOntology
-    from core.ontology.ingredient_schema import Ingredient
-    with tempfile.TemporaryDirectory() as tmp:
-        path = Path(tmp) / "dynamic_ontology.json"
-        dyn = DynamicOntology(path=path)
-        ing = Ingredient(
-            id="test_custom_1",
-            canonical_name="custom flour",
-            aliases=[],
-            derived_from=[],
-            contains=[],
-            may_contain=[],
-            animal_origin=False,
-            plant_origin=True,
-            synthetic=False,
-            fungal=False,
-            insect_derived=False,
-            animal_species=None,
-            egg_source=False,
-            dairy_source=False,
-            gluten_source=True,
-            nut_source=None,
-            soy_source=False,
-            sesame_source=False,
-            alcohol_content=None,
-            root_vegetable=False,
-            onion_source=False,
-            garlic_source=False,
-            fermented=False,
-            uncertainty_flags=[],
-            regions=[],
-        )
-        dyn.append(ing, source="test", confidence="high", persist=True)
-        assert path.exists()
-        data = json.loads(path.read_text())
-        assert len(data["ingredients"]) == 1
-        assert data["ingredients"][0]["canonical_name"] == "custom flour"
-        assert data["ingredients"][0].get("_enrichment_source") == "test"
+    path = tmp_path / "dynamic_ontology.json"
+    dyn = DynamicOntology(path=path)
+    ing = make_ingredient(id="test_custom_1", canonical_name="custom flour", gluten_source=True)
+    dyn.append(ing, source="test", confidence="high", persist=True)
+    assert path.exists()
+    data = json.loads(path.read_text())
+    assert len(data["ingredients"]) == 1
+    assert data["ingredients"][0]["canonical_name"] == "custom flour"
+    assert data["ingredients"][0].get("_enrichment_source") == "test"
 
 
-def test_dynamic_ontology_dedupe_by_id():
+def test_dynamic_ontology_dedupe_by_id(tmp_path, make_ingredient):
     """Appending same id again does not duplicate."""
-    from core.enrichment.dynamic_ontology import DynamicOntology
-    from core.ontology.ingredient_schema import Ingredient
-    with tempfile.TemporaryDirectory() as tmp:
-        path = Path(tmp) / "dynamic_ontology.json"
-        dyn = DynamicOntology(path=path)
-        ing = Ingredient(
-            id="dedupe_id",
-            canonical_name="one",
-            aliases=[],
-            derived_from=[],
-            contains=[],
-            may_contain=[],
-            animal_origin=False,
-            plant_origin=True,
-            synthetic=False,
-            fungal=False,
-            insect_derived=False,
-            animal_species=None,
-            egg_source=False,
-            dairy_source=False,
-            gluten_source=False,
-            nut_source=None,
-            soy_source=False,
-            sesame_source=False,
-            alcohol_content=None,
-            root_vegetable=False,
-            onion_source=False,
-            garlic_source=False,
-            fermented=False,
-            uncertainty_flags=[],
-            regions=[],
-        )
-        dyn.append(ing, source="test", confidence="high", persist=True)
-        dyn.append(ing, source="test", confidence="high", persist=True)
-        data = json.loads(path.read_text())
-        assert len(data["ingredients"]) == 1
+    dyn = DynamicOntology(path=tmp_path / "dynamic_ontology.json")
+    ing = make_ingredient(id="dedupe_id", canonical_name="one")
+    dyn.append(ing, source="test", confidence="high", persist=False)
+    dyn.append(ing, source="test", confidence="high", persist=False)
+    assert [d["id"] for d in dyn.get_ingredient_dicts()] == ["dedupe_id"]
+
+
+def test_dynamic_ontology_failed_save_keeps_previous_file(tmp_path, make_ingredient, monkeypatch):
+    """A write that fails midway leaves the previous file intact and no temp file behind."""
+    path = tmp_path / "dynamic_ontology.json"
+    dyn = DynamicOntology(path=path)
+    dyn.append(make_ingredient(id="kept", canonical_name="kept"), source="test", confidence="high", persist=True)
+    before = path.read_text()
+
+    def _fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("core.config.os.replace", _fail)
+    with pytest.raises(OSError):
+        dyn.append(make_ingredient(id="lost", canonical_name="lost"), source="test", confidence="high", persist=True)
+    assert path.read_text() == before
+    assert [p.name for p in tmp_path.iterdir()] == ["dynamic_ontology.json"]
@@ -343,3 +343,35 @@ def test_response_is_ike2_when_disagrees_with_legacy(monkeypatch):
     out = run_new_engine_chat(["gelatin"], restriction_ids=["vegan"], use_api_fallback=False)
     assert out.status == VerdictStatus.NOT_SAFE
     assert captured["primary_status"] == "NOT_SAFE"
+
+
+# ---------------------------------------------------------------------------
+# Repeat checks: fully resolved IKE-2 results are reused
+# ---------------------------------------------------------------------------
+
+def test_repeat_resolved_label_skips_rule_reload(monkeypatch):
+    import core.bridge as bridge
+
+    bridge.clear_ike2_result_cache()
+    calls = []
+    real_load = bridge.ike2_rules.load_rules
+    monkeypatch.setattr(
+        bridge.ike2_rules, "load_rules", lambda *a, **k: calls.append(1) or real_load(*a, **k)
+    )
+
+    first = run_new_engine_chat(["gelatin"], restriction_ids=["vegan"], use_api_fallback=False)
+    again = run_new_engine_chat(["gelatin"], restriction_ids=["vegan"], use_api_fallback=False)
+    run_new_engine_chat(["gelatin"], restriction_ids=["vegetarian"], use_api_fallback=False)
+
+    assert first.status == again.status == VerdictStatus.NOT_SAFE
+    assert first.triggered_ingredients == again.triggered_ingredients
+    assert len(calls) == 2  # one per distinct restriction set
+    bridge.clear_ike2_result_cache()
+
+
+def test_unresolved_label_is_not_cached(monkeypatch):
+    import core.bridge as bridge
+
+    bridge.clear_ike2_result_cache()
+    run_new_engine_chat(["zzqx unknownium"], restriction_ids=["vegan"], use_api_fallback=False)
+    assert not bridge._ike2_result_cache
@@ -0,0 +1,74 @@
+"""Layer 1 ingestion: alias writes are batched into one lookup + one insert."""
+from types import SimpleNamespace
+
+from core.knowledge.ingest import ensure_group_with_aliases
+
+
+class _Query:
+    def __init__(self, client, table):
+        self.client, self.table, self.op, self.payload = client, table, "select", None
+
+    def select(self, *_a):
+        return self
+
+    def eq(self, *_a):
+        return self
+
+    def is_(self, *_a):
+        return self
+
+    def limit(self, *_a):
+        return self
+
+    def in_(self, _col, values):
+        self.payload = values
+        return self
+
+    def insert(self, payload):
+        self.op, self.payload = "insert", payload
+        return self
+
+    def execute(self):
+        self.client.calls.append((self.table, self.op, self.payload))
+        if self.table == "ingredient_aliases" and self.op == "select":
+            return SimpleNamespace(data=[{"normalized_alias": a} for a in self.client.existing])
+        if self.table == "ingredient_aliases" and self.op == "insert":
+            if isinstance(self.payload, list) and self.client.fail_batch:
+                raise RuntimeError("duplicate key")
+            return SimpleNamespace(data=[])
+        return SimpleNamespace(data=[{"id": "id-1"}])
+
+
+class _Client:
+    def __init__(self, existing=(), fail_batch=False):
+        self.existing, self.fail_batch, self.calls = list(existing), fail_batch, []
+
+    def table(self, name):
+        return _Query(self, name)
+
+
+def _alias_calls(client):
+    return [c for c in client.calls if c[0] == "ingredient_aliases"]
+
+
+def test_aliases_use_one_lookup_and_one_bulk_insert():
+    client = _Client(existing=["tofu"])
+    db = SimpleNamespace(enabled=True, _client=client)
+    gid = ensure_group_with_aliases(db, "Tofu", ["Bean curd", "Soy curd", "bean curd"], source="ontology")
+
+    assert gid == "id-1"
+    calls = _alias_calls(client)
+    assert [op for _, op, _ in calls] == ["select", "insert"]
+    inserted = calls[1][2]
+    assert [r["normalized_alias"] for r in inserted] == ["bean curd", "soy curd"]
+    assert all(r["alias_type"] == "synonym" for r in inserted)
+
+
+def test_batch_conflict_falls_back_to_per_row_inserts():
+    client = _Client(fail_batch=True)
+    db = SimpleNamespace(enabled=True, _client=client)
+    ensure_group_with_aliases(db, "Tofu", ["Bean curd"], source="ontology")
+
+    inserts = [p for _, op, p in _alias_calls(client) if op == "insert"]
+    assert isinstance(inserts[0], list)
+    assert [p["normalized_alias"] for p in inserts[1:]] == ["tofu", "bean curd"]
@@ -2,15 +2,17 @@
 Tests for the intent detector and response composer.
 Covers conversational cases, profile persistence, mixed intents, and edge cases.
 """
+import dataclasses
+import functools
 import json
 import pytest
-import sys
-import os
 from pathlib import Path
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-
-from core.intent_detector import detect_intent
+from core.bridge import run_new_engine_chat, user_profile_model_to_restriction_ids
+from core.intent_detector import _detect_intent_cached, detect_intent
+from core.models.user_profile import UserProfile
+from core.models.verdict import VerdictStatus
+from core.ontology.ingredient_registry import _is_valid_ingredient_input
 
 
 # ===== MIXED intent: profile + ingredient ====================================
@@ -342,10 +344,6 @@ class TestIntentToCompliance:
 
     def test_jain_eggs_not_safe(self):
         """'I am Jain can I eat eggs?' → eggs NOT_SAFE for Jain."""
-        from core.bridge import run_new_engine_chat, user_profile_model_to_restriction_ids
-        from core.models.user_profile import UserProfile
-        from core.models.verdict import VerdictStatus
-
         parsed = detect_intent("I am Jain can I eat eggs?")
         assert parsed.intent == "MIXED"
         assert parsed.profile_updates.get("dietary_preference") == "Jain"
@@ -369,10 +367,6 @@ class TestIntentToCompliance:
 
     def test_vegan_cheese_not_safe(self):
         """'I am vegan. Is cheese okay?' → cheese NOT_SAFE for vegan."""
-        from core.bridge import run_new_engine_chat, user_profile_model_to_restriction_ids
-        from core.models.user_profile import UserProfile
-        from core.models.verdict import VerdictStatus
-
         parsed = detect_intent("I am vegan. Is cheese okay?")
         profile = UserProfile(user_id="test")
         profile.update_merge(dietary_preference="Vegan")
@@ -382,10 +376,6 @@ class TestIntentToCompliance:
 
     def test_jain_rice_safe(self):
         """'I am Jain. Can I eat rice?' → rice SAFE for Jain."""
-        from core.bridge import run_new_engine_chat, user_profile_model_to_restriction_ids
-        from core.models.user_profile import UserProfile
-        from core.models.verdict import VerdictStatus
-
         parsed = detect_intent("I am Jain. Can I eat rice?")
         profile = UserProfile(user_id="test")
         profile.update_merge(dietary_preference="Jain")
@@ -395,10 +385,6 @@ class TestIntentToCompliance:
 
     def test_halal_pork_not_safe(self):
         """'I follow halal, can I eat pork?' → pork NOT_SAFE for halal."""
-        from core.bridge import run_new_engine_chat, user_profile_model_to_restriction_ids
-        from core.models.user_profile import UserProfile
-        from core.models.verdict import VerdictStatus
-
         parsed = detect_intent("I follow halal, can I eat pork?")
         profile = UserProfile(user_id="test")
         profile.update_merge(dietary_preference="Halal")
@@ -408,10 +394,6 @@ class TestIntentToCompliance:
 
     def test_vegetarian_tofu_safe(self):
         """'Can I eat tofu?' with vegetarian profile → SAFE."""
-        from core.bridge import run_new_engine_chat, user_profile_model_to_restriction_ids
-        from core.models.user_profile import UserProfile
-        from core.models.verdict import VerdictStatus
-
         parsed = detect_intent("Can I eat tofu?")
         profile = UserProfile(user_id="test")
         profile.update_merge(dietary_preference="Vegetarian")
@@ -421,10 +403,6 @@ class TestIntentToCompliance:
 
     def test_jain_onion_not_safe(self):
         """Onion NOT_SAFE for Jain."""
-        from core.bridge import run_new_engine_chat, user_profile_model_to_restriction_ids
-        from core.models.user_profile import UserProfile
-        from core.models.verdict import VerdictStatus
-
         parsed = detect_intent("Can I eat onion?")
         profile = UserProfile(user_id="test")
         profile.update_merge(dietary_preference="Jain")
@@ -434,10 +412,6 @@ class TestIntentToCompliance:
 
     def test_no_restrictions_everything_safe(self):
         """With 'No rules', IKE-2 fails closed to UNCERTAIN (not legacy's SAFE)."""
-        from core.bridge import run_new_engine_chat, user_profile_model_to_restriction_ids
-        from core.models.user_profile import UserProfile
-        from core.models.verdict import VerdictStatus
-
         profile = UserProfile(user_id="test")  # No rules by default
         rids = user_profile_model_to_restriction_ids(profile)
         verdict = run_new_engine_chat(
@@ -453,10 +427,6 @@ class TestIntentToCompliance:
 
     def test_can_jain_eat_onion_not_safe(self):
         """THE critical bug: 'can jain eat onion?' → onion NOT_SAFE for Jain."""
-        from core.bridge import run_new_engine_chat, user_profile_model_to_restriction_ids
-        from core.models.user_profile import UserProfile
-        from core.models.verdict import VerdictStatus
-
         parsed = detect_intent("can jain eat onion?")
         assert parsed.intent == "MIXED"
         profile = UserProfile(user_id="test")
@@ -467,10 +437,6 @@ class TestIntentToCompliance:
 
     def test_is_pork_halal_not_safe(self):
         """'is pork halal?' → pork NOT_SAFE for Halal."""
-        from core.bridge import run_new_engine_chat, user_profile_model_to_restriction_ids
-        from core.models.user_profile import UserProfile
-        from core.models.verdict import VerdictStatus
-
         parsed = detect_intent("is pork halal?")
         profile = UserProfile(user_id="test")
         profile.update_merge(dietary_preference="Halal")
@@ -480,10 +446,6 @@ class TestIntentToCompliance:
 
     def test_can_vegans_eat_honey_not_safe(self):
         """Honey NOT_SAFE for vegan (insect_derived)."""
-        from core.bridge import run_new_engine_chat, user_profile_model_to_restriction_ids
-        from core.models.user_profile import UserProfile
-        from core.models.verdict import VerdictStatus
-
         parsed = detect_intent("can vegans eat honey?")
         profile = UserProfile(user_id="test")
         profile.update_merge(dietary_preference="Vegan")
@@ -493,10 +455,6 @@ class TestIntentToCompliance:
 
     def test_is_gelatin_kosher_not_safe(self):
         """Gelatin NOT_SAFE for Kosher (animal_species=pig typically)."""
-        from core.bridge import run_new_engine_chat, user_profile_model_to_restriction_ids
-        from core.models.user_profile import UserProfile
-        from core.models.verdict import VerdictStatus
-
         parsed = detect_intent("is gelatin kosher?")
         profile = UserProfile(user_id="test")
         profile.update_merge(dietary_preference="Kosher")
@@ -507,10 +465,6 @@ class TestIntentToCompliance:
 
     def test_jain_garlic_not_safe(self):
         """Garlic NOT_SAFE for Jain."""
-        from core.bridge import run_new_engine_chat, user_profile_model_to_restriction_ids
-        from core.models.user_profile import UserProfile
-        from core.models.verdict import VerdictStatus
-
         parsed = detect_intent("does jain allow garlic?")
         profile = UserProfile(user_id="test")
         profile.update_merge(dietary_preference="Jain")
@@ -520,7 +474,6 @@ class TestIntentToCompliance:
 
     def test_input_validation_rejects_sentences(self):
         """Sentences should not be sent to the API as ingredient names."""
-        from core.ontology.ingredient_registry import _is_valid_ingredient_input
         assert _is_valid_ingredient_input("onion") is True
         assert _is_valid_ingredient_input("chicken breast") is True
         assert _is_valid_ingredient_input("can jain eat onion") is False
@@ -528,353 +481,130 @@ class TestIntentToCompliance:
         assert _is_valid_ingredient_input("does vegan allow this ingredient") is False
 
 
+_RESTRICTION_CASES = [
+    # VEGAN
+    ("vegan_milk_not_safe", "Vegan", "milk", VerdictStatus.NOT_SAFE),
+    ("vegan_egg_not_safe", "Vegan", "egg", VerdictStatus.NOT_SAFE),
+    ("vegan_honey_not_safe", "Vegan", "honey", VerdictStatus.NOT_SAFE),
+    ("vegan_gelatin_not_safe", "Vegan", "gelatin", VerdictStatus.NOT_SAFE),
+    ("vegan_rice_safe", "Vegan", "rice", VerdictStatus.SAFE),
+    ("vegan_tofu_safe", "Vegan", "tofu", VerdictStatus.SAFE),
+    # VEGETARIAN
+    ("vegetarian_chicken_not_safe", "Vegetarian", "chicken", VerdictStatus.NOT_SAFE),
+    ("vegetarian_fish_not_safe", "Vegetarian", "fish", VerdictStatus.NOT_SAFE),
+    ("vegetarian_gelatin_not_safe", "Vegetarian", "gelatin", VerdictStatus.NOT_SAFE),
+    ("vegetarian_milk_safe", "Vegetarian", "milk", VerdictStatus.SAFE),
+    ("vegetarian_egg_safe", "Vegetarian", "egg", VerdictStatus.SAFE),
+    # HALAL
+    ("halal_pork_not_safe", "Halal", "pork", VerdictStatus.NOT_SAFE),
+    ("halal_lard_not_safe", "Halal", "lard", VerdictStatus.NOT_SAFE),
+    ("halal_gelatin_not_safe", "Halal", "gelatin", VerdictStatus.NOT_SAFE),
+    ("halal_alcohol_not_safe", "Halal", "wine", VerdictStatus.NOT_SAFE),
+    ("halal_chicken_safe", "Halal", "chicken", VerdictStatus.SAFE),
+    ("halal_lamb_safe", "Halal", "lamb", VerdictStatus.SAFE),
+    # KOSHER
+    ("kosher_pork_not_safe", "Kosher", "pork", VerdictStatus.NOT_SAFE),
+    ("kosher_shellfish_not_safe", "Kosher", "shrimp", VerdictStatus.NOT_SAFE),
+    ("kosher_gelatin_not_safe", "Kosher", "gelatin", VerdictStatus.NOT_SAFE),
+    ("kosher_chicken_safe", "Kosher", "chicken", VerdictStatus.SAFE),
+    # JAIN
+    ("jain_onion_not_safe", "Jain", "onion", VerdictStatus.NOT_SAFE),
+    ("jain_garlic_not_safe", "Jain", "garlic", VerdictStatus.NOT_SAFE),
+    ("jain_egg_not_safe", "Jain", "egg", VerdictStatus.NOT_SAFE),
+    ("jain_potato_not_safe", "Jain", "potato", VerdictStatus.NOT_SAFE),
+    ("jain_mushroom_not_safe", "Jain", "mushroom", VerdictStatus.NOT_SAFE),
+    ("jain_honey_not_safe", "Jain", "honey", VerdictStatus.NOT_SAFE),
+    ("jain_gelatin_not_safe", "Jain", "gelatin", VerdictStatus.NOT_SAFE),
+    ("jain_rice_safe", "Jain", "rice", VerdictStatus.SAFE),
+    ("jain_wheat_safe", "Jain", "wheat", VerdictStatus.SAFE),
+    ("jain_milk_safe", "Jain", "milk", VerdictStatus.SAFE),
+    ("jain_wine_not_safe", "Jain", "wine", VerdictStatus.NOT_SAFE),
+    # HINDU VEG (canonical display: Hindu Vegetarian)
+    ("hindu_veg_beef_not_safe", "Hindu Vegetarian", "beef", VerdictStatus.NOT_SAFE),
+    ("hindu_veg_egg_not_safe", "Hindu Vegetarian", "egg", VerdictStatus.NOT_SAFE),
+    ("hindu_veg_fish_not_safe", "Hindu Vegetarian", "fish", VerdictStatus.NOT_SAFE),
+    ("hindu_veg_milk_safe", "Hindu Vegetarian", "milk", VerdictStatus.SAFE),
+    ("hindu_veg_ghee_safe", "Hindu Vegetarian", "ghee", VerdictStatus.SAFE),
+    # HINDU NON-VEG
+    ("hindu_nonveg_beef_not_safe", "Hindu Non Vegetarian", "beef", VerdictStatus.NOT_SAFE),
+    ("hindu_nonveg_pork_not_safe", "Hindu Non Vegetarian", "pork", VerdictStatus.NOT_SAFE),
+    ("hindu_nonveg_chicken_safe", "Hindu Non Vegetarian", "chicken", VerdictStatus.SAFE),
+    ("hindu_nonveg_lamb_safe", "Hindu Non Vegetarian", "lamb", VerdictStatus.SAFE),
+    # PESCATARIAN
+    ("pescatarian_chicken_not_safe", "Pescatarian", "chicken", VerdictStatus.NOT_SAFE),
+    ("pescatarian_beef_not_safe", "Pescatarian", "beef", VerdictStatus.NOT_SAFE),
+    ("pescatarian_fish_safe", "Pescatarian", "fish", VerdictStatus.SAFE),
+    ("pescatarian_salmon_safe", "Pescatarian", "salmon", VerdictStatus.SAFE),
+    # LACTO-VEGETARIAN
+    ("lacto_veg_egg_not_safe", "Lacto Vegetarian", "egg", VerdictStatus.NOT_SAFE),
+    ("lacto_veg_chicken_not_safe", "Lacto Vegetarian", "chicken", VerdictStatus.NOT_SAFE),
+    ("lacto_veg_milk_safe", "Lacto Vegetarian", "milk", VerdictStatus.SAFE),
+    # OVO-VEGETARIAN
+    ("ovo_veg_milk_not_safe", "Ovo Vegetarian", "milk", VerdictStatus.NOT_SAFE),
+    ("ovo_veg_egg_safe", "Ovo Vegetarian", "egg", VerdictStatus.SAFE),
+    # GLUTEN-FREE
+    ("gluten_free_wheat_not_safe", "Gluten-Free", "wheat", VerdictStatus.NOT_SAFE),
+    ("gluten_free_barley_not_safe", "Gluten-Free", "barley", VerdictStatus.NOT_SAFE),
+    ("gluten_free_rice_safe", "Gluten-Free", "rice", VerdictStatus.SAFE),
+]
+
+
+@pytest.fixture(scope="module")
+def flow_profile():
+    """Shared empty profile; flow tests derive per-diet copies with dataclasses.replace."""
+    return UserProfile(user_id="flow_test")
+
+
 class TestComprehensiveRestrictions:
     """End-to-end compliance tests for ALL dietary/religious restrictions."""
 
     @staticmethod
-    def _verdict(diet: str, ingredients: list):
-        from core.bridge import run_new_engine_chat, user_profile_model_to_restriction_ids
-        from core.models.user_profile import UserProfile
+    @functools.lru_cache(maxsize=16)
+    def _profile_rids(diet: str):
+        """One profile + restriction-id tuple per diet; the engine never mutates either."""
         profile = UserProfile(user_id="test")
         profile.update_merge(dietary_preference=diet)
-        rids = user_profile_model_to_restriction_ids(profile)
-        return run_new_engine_chat(ingredients, user_profile=profile, restriction_ids=rids)
-
-    # === VEGAN ===
-    def test_vegan_milk_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Vegan", ["milk"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_vegan_egg_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Vegan", ["egg"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_vegan_honey_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Vegan", ["honey"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_vegan_gelatin_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Vegan", ["gelatin"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_vegan_rice_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Vegan", ["rice"])
-        assert v.status == VerdictStatus.SAFE
-
-    def test_vegan_tofu_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Vegan", ["tofu"])
-        assert v.status == VerdictStatus.SAFE
-
-    # === VEGETARIAN ===
-    def test_vegetarian_chicken_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Vegetarian", ["chicken"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_vegetarian_fish_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Vegetarian", ["fish"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_vegetarian_gelatin_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Vegetarian", ["gelatin"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_vegetarian_milk_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Vegetarian", ["milk"])
-        assert v.status == VerdictStatus.SAFE
-
-    def test_vegetarian_egg_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Vegetarian", ["egg"])
-        assert v.status == VerdictStatus.SAFE
-
-    # === HALAL ===
-    def test_halal_pork_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Halal", ["pork"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_halal_lard_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Halal", ["lard"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_halal_gelatin_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Halal", ["gelatin"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_halal_alcohol_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Halal", ["wine"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_halal_chicken_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Halal", ["chicken"])
-        assert v.status == VerdictStatus.SAFE
-
-    def test_halal_lamb_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Halal", ["lamb"])
-        assert v.status == VerdictStatus.SAFE
-
-    # === KOSHER ===
-    def test_kosher_pork_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Kosher", ["pork"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_kosher_shellfish_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Kosher", ["shrimp"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_kosher_gelatin_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Kosher", ["gelatin"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_kosher_chicken_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Kosher", ["chicken"])
-        assert v.status == VerdictStatus.SAFE
-
-    # === JAIN ===
-    def test_jain_onion_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Jain", ["onion"])
-        assert v.status == VerdictStatus.NOT_SAFE
+        return profile, tuple(user_profile_model_to_restriction_ids(profile))
 
-    def test_jain_garlic_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Jain", ["garlic"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_jain_egg_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Jain", ["egg"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_jain_potato_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Jain", ["potato"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_jain_mushroom_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Jain", ["mushroom"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_jain_honey_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Jain", ["honey"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_jain_gelatin_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Jain", ["gelatin"])
-        assert v.status == VerdictStatus.NOT_SAFE
+    @classmethod
+    def _verdict(cls, diet: str, ingredients: list):
+        profile, rids = cls._profile_rids(diet)
+        return run_new_engine_chat(ingredients, user_profile=profile, restriction_ids=list(rids))
 
-    def test_jain_rice_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Jain", ["rice"])
-        assert v.status == VerdictStatus.SAFE
-
-    def test_jain_wheat_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Jain", ["wheat"])
-        assert v.status == VerdictStatus.SAFE
-
-    def test_jain_milk_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Jain", ["milk"])
-        assert v.status == VerdictStatus.SAFE
-
-    def test_jain_wine_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Jain", ["wine"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    # === HINDU VEG (canonical display: Hindu Vegetarian) ===
-    def test_hindu_veg_beef_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Hindu Vegetarian", ["beef"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_hindu_veg_egg_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Hindu Vegetarian", ["egg"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_hindu_veg_fish_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Hindu Vegetarian", ["fish"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_hindu_veg_milk_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Hindu Vegetarian", ["milk"])
-        assert v.status == VerdictStatus.SAFE
-
-    def test_hindu_veg_ghee_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Hindu Vegetarian", ["ghee"])
-        assert v.status == VerdictStatus.SAFE
-
-    # === HINDU NON-VEG ===
-    def test_hindu_nonveg_beef_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Hindu Non Vegetarian", ["beef"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_hindu_nonveg_pork_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Hindu Non Vegetarian", ["pork"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_hindu_nonveg_chicken_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Hindu Non Vegetarian", ["chicken"])
-        assert v.status == VerdictStatus.SAFE
-
-    def test_hindu_nonveg_lamb_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Hindu Non Vegetarian", ["lamb"])
-        assert v.status == VerdictStatus.SAFE
-
-    # === PESCATARIAN ===
-    def test_pescatarian_chicken_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Pescatarian", ["chicken"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_pescatarian_beef_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Pescatarian", ["beef"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_pescatarian_fish_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Pescatarian", ["fish"])
-        assert v.status == VerdictStatus.SAFE
-
-    def test_pescatarian_salmon_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Pescatarian", ["salmon"])
-        assert v.status == VerdictStatus.SAFE
-
-    # === LACTO-VEGETARIAN ===
-    def test_lacto_veg_egg_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Lacto Vegetarian", ["egg"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_lacto_veg_chicken_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Lacto Vegetarian", ["chicken"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_lacto_veg_milk_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Lacto Vegetarian", ["milk"])
-        assert v.status == VerdictStatus.SAFE
-
-    # === OVO-VEGETARIAN ===
-    def test_ovo_veg_milk_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Ovo Vegetarian", ["milk"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_ovo_veg_egg_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Ovo Vegetarian", ["egg"])
-        assert v.status == VerdictStatus.SAFE
-
-    # === GLUTEN-FREE ===
-    def test_gluten_free_wheat_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Gluten-Free", ["wheat"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_gluten_free_barley_not_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Gluten-Free", ["barley"])
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_gluten_free_rice_safe(self):
-        from core.models.verdict import VerdictStatus
-        v = self._verdict("Gluten-Free", ["rice"])
-        assert v.status == VerdictStatus.SAFE
+    @pytest.mark.parametrize(
+        "diet,ingredient,expected",
+        [pytest.param(diet, ing, exp, id=case_id) for case_id, diet, ing, exp in _RESTRICTION_CASES],
+    )
+    def test_single_ingredient_verdict(self, diet, ingredient, expected):
+        assert self._verdict(diet, [ingredient]).status is expected
 
     # === CONVERSATIONAL NL → COMPLIANCE FLOW ===
-    def test_can_jain_eat_onion_full_flow(self):
-        """Full conversational flow: 'can jain eat onion?' → MIXED → NOT_SAFE."""
-        from core.bridge import run_new_engine_chat, user_profile_model_to_restriction_ids
-        from core.models.user_profile import UserProfile
-        from core.models.verdict import VerdictStatus
-
-        parsed = detect_intent("can jain eat onion?")
-        assert parsed.intent == "MIXED"
-        assert parsed.profile_updates.get("dietary_preference") == "Jain"
-        assert any("onion" in i.lower() for i in parsed.ingredients)
-
-        profile = UserProfile(user_id="flow_test")
-        profile.update_merge(dietary_preference=parsed.profile_updates["dietary_preference"])
-        rids = user_profile_model_to_restriction_ids(profile)
-        v = run_new_engine_chat(parsed.ingredients, user_profile=profile, restriction_ids=rids)
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_is_mushroom_jain_full_flow(self):
-        """'is mushroom jain?' → MIXED → NOT_SAFE (fungal)."""
-        from core.bridge import run_new_engine_chat, user_profile_model_to_restriction_ids
-        from core.models.user_profile import UserProfile
-        from core.models.verdict import VerdictStatus
-
-        parsed = detect_intent("is mushroom jain?")
-        assert parsed.intent == "MIXED"
-        profile = UserProfile(user_id="flow_test")
-        profile.update_merge(dietary_preference="Jain")
-        rids = user_profile_model_to_restriction_ids(profile)
-        v = run_new_engine_chat(parsed.ingredients, user_profile=profile, restriction_ids=rids)
-        assert v.status == VerdictStatus.NOT_SAFE
-
-    def test_can_vegans_eat_honey_full_flow(self):
-        """'can vegans eat honey?' → MIXED → NOT_SAFE."""
-        from core.bridge import run_new_engine_chat, user_profile_model_to_restriction_ids
-        from core.models.user_profile import UserProfile
-        from core.models.verdict import VerdictStatus
-
-        parsed = detect_intent("can vegans eat honey?")
+    # Intent parsing is checked for every utterance; the per-diet verdicts are
+    # covered by _RESTRICTION_CASES, so only one case runs the full round-trip.
+    @pytest.mark.parametrize(
+        "utterance,diet,ingredient",
+        [
+            ("can jain eat onion?", "Jain", "onion"),
+            ("is mushroom jain?", "Jain", "mushroom"),  # fungal
+            ("can vegans eat honey?", "Vegan", "honey"),
+            ("does halal allow wine?", "Halal", "wine"),
+        ],
+    )
+    def test_conversational_intent_mixed(self, utterance, diet, ingredient):
+        """'<diet question>' → MIXED with the diet as a profile update and the ingredient extracted."""
+        parsed = detect_intent(utterance)
         assert parsed.intent == "MIXED"
-        profile = UserProfile(user_id="flow_test")
-        profile.update_merge(dietary_preference="Vegan")
-        rids = user_profile_model_to_restriction_ids(profile)
-        v = run_new_engine_chat(parsed.ingredients, user_profile=profile, restriction_ids=rids)
-        assert v.status == VerdictStatus.NOT_SAFE
+        assert parsed.profile_updates.get("dietary_preference") == diet
+        assert any(ingredient in i.lower() for i in parsed.ingredients)
 
-    def test_does_halal_allow_wine_full_flow(self):
-        """'does halal allow wine?' → MIXED → NOT_SAFE."""
-        from core.bridge import run_new_engine_chat, user_profile_model_to_restriction_ids
-        from core.models.user_profile import UserProfile
-        from core.models.verdict import VerdictStatus
-
-        parsed = detect_intent("does halal allow wine?")
+    def test_conversational_full_flow_not_safe(self, flow_profile):
+        """Full conversational flow: 'can jain eat onion?' → MIXED → NOT_SAFE."""
+        parsed = detect_intent("can jain eat onion?")
         assert parsed.intent == "MIXED"
-        profile = UserProfile(user_id="flow_test")
-        profile.update_merge(dietary_preference="Halal")
+        profile = dataclasses.replace(flow_profile, dietary_preference=parsed.profile_updates["dietary_preference"])
         rids = user_profile_model_to_restriction_ids(profile)
         v = run_new_engine_chat(parsed.ingredients, user_profile=profile, restriction_ids=rids)
-        assert v.status == VerdictStatus.NOT_SAFE
+        assert v.status is VerdictStatus.NOT_SAFE
 
 
 # ===== Phase 5: junk / chat corpus — no compliance ingredients =================
@@ -908,3 +638,16 @@ class TestMultiBlockIntent:
         joined = " ".join(i.lower() for i in result.ingredients)
         assert "mi1k" in joined or "milk" in joined
         assert "fl0ur" in joined or "flour" in joined
+
+
+class TestDetectIntentMemo:
+    def test_repeat_query_is_cached_and_results_are_independent(self):
+        q = "I am vegan and allergic to peanuts. Can I eat tofu, rice?"
+        first = detect_intent(q)
+        first.ingredients.append("mutated")
+        first.profile_updates["allergens"].append("mutated")
+        second = detect_intent(q)
+        assert "mutated" not in second.ingredients
+        assert "mutated" not in second.profile_updates["allergens"]
+        assert second.profile_updates["dietary_preference"] == "Vegan"
+        assert _detect_intent_cached.cache_info().hits >= 1
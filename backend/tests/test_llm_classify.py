@@ -0,0 +1,43 @@
+"""LLM ingredient classification: exact-match cache avoids repeat Ollama calls."""
+from unittest.mock import MagicMock
+
+import requests
+
+from core.knowledge import llm_classify
+from core.llm_http import get_ollama_session
+
+
+def _fake_post(payload: str):
+    resp = MagicMock()
+    resp.json.return_value = {"response": payload}
+    resp.raise_for_status.return_value = None
+    return MagicMock(return_value=resp)
+
+
+def setup_function(_fn):
+    llm_classify.clear_classification_cache()
+
+
+def test_repeat_classification_served_from_cache(monkeypatch):
+    post = _fake_post('{"origin_type": "insect", "animal_origin": true}')
+    monkeypatch.setattr(llm_classify, "llm_enabled", lambda: True)
+    monkeypatch.setattr(get_ollama_session(), "post", post)
+
+    first = llm_classify.classify_ingredient_origin("Carmine")
+    second = llm_classify.classify_ingredient_origin("carmine ")
+
+    assert first == second == {"origin_type": "insect", "animal_origin": True}
+    assert post.call_count == 1
+    # Callers get their own copy; mutating it must not poison the cache.
+    second["animal_origin"] = False
+    assert llm_classify.classify_ingredient_origin("carmine")["animal_origin"] is True
+
+
+def test_failures_are_not_cached(monkeypatch):
+    post = MagicMock(side_effect=requests.ConnectionError("down"))
+    monkeypatch.setattr(llm_classify, "llm_enabled", lambda: True)
+    monkeypatch.setattr(get_ollama_session(), "post", post)
+
+    assert llm_classify.classify_ingredient_origin("chickpea") is None
+    assert llm_classify.classify_ingredient_origin("chickpea") is None
+    assert post.call_count == 2
@@ -0,0 +1,15 @@
+"""Shared Ollama session: one pooled, process-wide instance."""
+from core.llm_http import OLLAMA_CONNECT_TIMEOUT, OLLAMA_POOL_SIZE, get_ollama_session, ollama_timeout
+
+
+def test_session_is_shared_and_pooled():
+    session = get_ollama_session()
+    assert get_ollama_session() is session
+    adapter = session.get_adapter("http://localhost:11434/api/generate")
+    assert adapter._pool_maxsize == OLLAMA_POOL_SIZE
+    assert adapter.max_retries.total == 2
+
+
+def test_timeout_fails_fast_on_connect_but_keeps_read_budget():
+    assert ollama_timeout(30) == (OLLAMA_CONNECT_TIMEOUT, 30)
+    assert OLLAMA_CONNECT_TIMEOUT < 30
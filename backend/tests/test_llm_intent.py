@@ -0,0 +1,30 @@
+"""LLM intent fallback: schema-constrained Ollama request and response normalization."""
+import json
+from unittest.mock import MagicMock
+
+from core import llm_intent
+from core.llm_http import get_ollama_session
+
+
+def _fake_post(payload: dict):
+    resp = MagicMock()
+    resp.json.return_value = {"response": json.dumps(payload)}
+    resp.raise_for_status.return_value = None
+    return MagicMock(return_value=resp)
+
+
+def test_request_carries_json_schema_and_result_is_normalized(monkeypatch):
+    post = _fake_post(
+        {"intent": "INGREDIENT_QUERY", "ingredients": [" eggs ", ""], "is_greeting": False}
+    )
+    monkeypatch.setattr(llm_intent, "llm_enabled", lambda: True)
+    monkeypatch.setattr(get_ollama_session(), "post", post)
+
+    out = llm_intent.llm_extract_intent("could I maybe have eggs")
+
+    body = post.call_args.kwargs["json"]
+    assert body["format"]["type"] == "object"
+    assert "GREETING" in body["format"]["properties"]["intent"]["enum"]
+    assert out["intent"] == "INGREDIENT_QUERY"
+    assert out["ingredients"] == ["eggs"]
+    assert out["allergens"] == []
@@ -0,0 +1,70 @@
+"""Ollama reply plumbing: token streaming and the temperature-0 reply cache."""
+import json
+from unittest.mock import MagicMock
+
+import requests
+
+from core import llm_response
+from core.llm_http import get_ollama_session
+
+
+def _stream_resp(chunks):
+    resp = MagicMock()
+    resp.__enter__.return_value = resp
+    resp.raise_for_status.return_value = None
+    resp.iter_lines.return_value = [json.dumps(c).encode() for c in chunks]
+    return resp
+
+
+def test_stream_general_yields_tokens_until_done(monkeypatch):
+    post = MagicMock(
+        return_value=_stream_resp(
+            [
+                {"response": "  Honey", "done": False},
+                {"response": " is not vegan.", "done": False},
+                {"response": "", "done": True},
+                {"response": "ignored", "done": False},
+            ]
+        )
+    )
+    monkeypatch.setattr(llm_response, "llm_enabled", lambda: True)
+    monkeypatch.setattr(get_ollama_session(), "post", post)
+
+    pieces = list(llm_response.llm_stream_general("is honey vegan?"))
+
+    assert pieces == ["Honey", " is not vegan."]
+    assert post.call_args.kwargs["json"]["stream"] is True
+    assert post.call_args.kwargs["stream"] is True
+
+
+def test_stream_general_yields_nothing_on_failure_or_disabled(monkeypatch):
+    monkeypatch.setattr(llm_response, "llm_enabled", lambda: True)
+    monkeypatch.setattr(
+        get_ollama_session(), "post", MagicMock(side_effect=requests.ConnectionError("down"))
+    )
+    assert list(llm_response.llm_stream_general("hello?")) == []
+
+    monkeypatch.setattr(llm_response, "llm_enabled", lambda: False)
+    assert list(llm_response.llm_stream_general("hello?")) == []
+
+
+def test_identical_prompt_is_answered_from_cache(monkeypatch):
+    llm_response.clear_reply_cache()
+    resp = MagicMock()
+    resp.raise_for_status.return_value = None
+    resp.json.return_value = {"response": " Hello there. "}
+    post = MagicMock(return_value=resp)
+    monkeypatch.setattr(llm_response, "llm_enabled", lambda: True)
+    monkeypatch.setattr(get_ollama_session(), "post", post)
+
+    assert llm_response._call_ollama("sys", "prompt") == "Hello there."
+    assert llm_response._call_ollama("sys", "prompt") == "Hello there."
+    assert post.call_count == 1
+    llm_response._call_ollama("sys", "another prompt")
+    assert post.call_count == 2
+
+    resp.json.return_value = {"response": ""}
+    llm_response._call_ollama("sys", "empty")
+    llm_response._call_ollama("sys", "empty")
+    assert post.call_count == 4  # empty replies are not cached
+    llm_response.clear_reply_cache()
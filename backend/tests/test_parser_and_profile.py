@@ -3,14 +3,35 @@ Unit tests: flatten_ingredients (parentheses, processed foods), UserProfile merg
 Run from backend: python -m pytest tests/test_parser_and_profile.py -v
 """
 import json
-import tempfile
 import pytest
-from pathlib import Path
+
+import app as app_module
+from core.bridge import run_new_engine_chat, user_profile_model_to_restriction_ids
+from core.intent_detector import detect_intent
+from core.models.user_profile import UserProfile
+from core.models.verdict import ComplianceVerdict, VerdictStatus
+from core.normalization import normalizer, parser
+from core.normalization.normalizer import normalize_ingredient_key
+from core.normalization.parser import flatten_ingredients
+from core.profile_storage import get_or_create_profile, update_profile_partial
+
+_SEED_PROFILES = {
+    "p1": {"dietary_preference": "Jain", "allergens": ["Nuts"], "lifestyle": []},
+    "test_u": {"user_id": "test_u", "dietary_preference": "Vegan", "allergens": [], "lifestyle": []},
+}
+
+
+@pytest.fixture
+def profiles_path(tmp_path):
+    """profiles.json seeded with the shared test profiles. Function-scoped because
+    profile storage writes back to the file."""
+    path = tmp_path / "profiles.json"
+    path.write_text(json.dumps(_SEED_PROFILES))
+    return path
 
 
 def test_flatten_ingredients_parentheses():
     """Parser splits parentheses and commas inside them."""
-    from core.normalization.parser import flatten_ingredients
     out = flatten_ingredients("Enriched Bleached Wheat Flour (Bleached Wheat Flour, Niacin, Folic Acid)")
     assert "bleached wheat flour" in out
     assert "niacin" in out
@@ -19,7 +40,6 @@ def test_flatten_ingredients_parentheses():
 
 def test_flatten_ingredients_category_expand():
     """X (A, B, C) expands when X is a known category: vegetable oil (sunflower, canola) -> sunflower oil, canola oil."""
-    from core.normalization.parser import flatten_ingredients
     out = flatten_ingredients("vegetable oil (sunflower, canola), salt")
     assert "sunflower oil" in out
     assert "canola oil" in out
@@ -28,7 +48,6 @@ def test_flatten_ingredients_category_expand():
 
 def test_flatten_ingredients_processed_food():
     """Processed foods map to base ingredients (e.g. potato chips -> potato, vegetable oil, salt)."""
-    from core.normalization.parser import flatten_ingredients
     out = flatten_ingredients("potato chips")
     assert "potato" in out
     assert "vegetable oil" in out
@@ -37,23 +56,30 @@ def test_flatten_ingredients_processed_food():
 
 def test_flatten_ingredients_potato_chips_uppercase():
     """Case-insensitive processed food match."""
-    from core.normalization.parser import flatten_ingredients
     out = flatten_ingredients("Potato Chips")
     assert "potato" in out
 
 
 def test_normalize_ingredient_key_variant():
     """Known variants (e.g. inglass -> isinglass) are applied for lookup."""
-    from core.normalization.normalizer import normalize_ingredient_key
     assert normalize_ingredient_key("inglass") == "isinglass"
     assert normalize_ingredient_key("Isinglass") == "isinglass"
     assert normalize_ingredient_key("fish gelatin") == "fish_gelatin"
     assert normalize_ingredient_key("  castoreum  ") == "castoreum"
 
 
+def test_normalize_ingredient_key_memoized_and_type_safe():
+    """Repeat keys are served from the memo; non-strings still normalize to ''."""
+    normalizer._normalize_ingredient_key_cached.cache_clear()
+    assert normalizer.normalize_ingredient_key("Baker's Yeast") == "bakers yeast"
+    assert normalizer.normalize_ingredient_key("Baker's Yeast") == "bakers yeast"
+    assert normalizer._normalize_ingredient_key_cached.cache_info().hits == 1
+    assert normalizer.normalize_ingredient_key(["milk"]) == ""
+    assert normalizer.normalize_ingredient_key(None) == ""
+
+
 def test_flatten_ingredients_enriched_wheat_flour_full():
     """Flatten full enriched flour string with parentheses and commas inside."""
-    from core.normalization.parser import flatten_ingredients
     raw = "Enriched Bleached Wheat Flour (Bleached Wheat Flour, Niacin, Reduced Iron, Thiamine Mononitrate, Riboflavin, Folic Acid)"
     out = flatten_ingredients(raw)
     assert "bleached wheat flour" in out
@@ -65,9 +91,19 @@ def test_flatten_ingredients_enriched_wheat_flour_full():
     assert len(out) >= 5
 
 
+def test_flatten_ingredients_memo_returns_fresh_lists():
+    """Repeat strings are served from the memo; callers may mutate what they get back."""
+    parser._flatten_ingredients_cached.cache_clear()
+    first = parser.flatten_ingredients("Potato Chips")
+    assert first == ["potato", "vegetable oil", "salt"]
+    first.append("mutated")
+    assert parser.flatten_ingredients("Potato Chips") == ["potato", "vegetable oil", "salt"]
+    assert parser._flatten_ingredients_cached.cache_info().hits == 1
+    assert parser.PROCESSED_FOOD_TO_BASE["potato chips"] == ["potato", "vegetable oil", "salt"]
+
+
 def test_user_profile_is_empty():
     """Empty profile (No rules, no allergens/lifestyle) is_empty()."""
-    from core.models.user_profile import UserProfile
     p = UserProfile(user_id="u1", dietary_preference="No rules", allergens=[], lifestyle=[])
     assert p.is_empty() is True
     p2 = UserProfile(user_id="u2", dietary_preference="Jain", allergens=[], lifestyle=[])
@@ -76,7 +112,6 @@ def test_user_profile_is_empty():
 
 def test_user_profile_update_merge():
     """Update_merge only changes provided fields; does not set others to None."""
-    from core.models.user_profile import UserProfile
     p = UserProfile(user_id="u1", dietary_preference="Vegan", allergens=["Milk"], lifestyle=[])
     p.update_merge(allergens=["Egg"])
     assert p.dietary_preference == "Vegan"
@@ -85,7 +120,6 @@ def test_user_profile_update_merge():
 
 def test_user_profile_from_dict():
     """from_dict accepts user_id, dietary_preference, allergens, lifestyle."""
-    from core.models.user_profile import UserProfile
     p = UserProfile.from_dict({
         "user_id": "u1",
         "dietary_preference": "Vegan",
@@ -98,27 +132,39 @@ def test_user_profile_from_dict():
     assert "no alcohol" in [x.lower() for x in p.lifestyle]
 
 
-def test_profile_storage_merge():
+def test_user_profile_to_dict_copies_lists():
+    """to_dict round-trips through from_dict and does not alias the profile's lists."""
+    p = UserProfile(user_id="u1", dietary_preference="Vegan", allergens=["Milk"], lifestyle=["no alcohol"])
+    d = p.to_dict()
+    assert d == {"user_id": "u1", "dietary_preference": "Vegan", "allergens": ["Milk"], "lifestyle": ["no alcohol"]}
+    d["allergens"].append("Egg")
+    assert p.allergens == ["Milk"]
+    assert UserProfile.from_dict(p.to_dict()) == p
+
+
+def test_restriction_ids_follow_profile_and_return_fresh_lists():
+    """Memoized restriction ids keep field order and reflect profile edits."""
+    p = UserProfile(user_id="u1", dietary_preference="Jain", allergens=["peanut", "milk"], lifestyle=["no alcohol"])
+    ids = user_profile_model_to_restriction_ids(p)
+    assert ids == ["jain", "peanut_allergy", "dairy_free", "no_alcohol"]
+    ids.append("mutated")
+    assert user_profile_model_to_restriction_ids(p) == ["jain", "peanut_allergy", "dairy_free", "no_alcohol"]
+    p.update_merge(allergens=["milk", "peanut"])
+    assert user_profile_model_to_restriction_ids(p) == ["jain", "dairy_free", "peanut_allergy", "no_alcohol"]
+
+
+def test_profile_storage_merge(profiles_path, monkeypatch):
     """update_profile_partial only updates provided fields; does not reset to None."""
-    from unittest.mock import patch
-    from core.profile_storage import update_profile_partial
-    from core.models.user_profile import UserProfile
-    with tempfile.TemporaryDirectory() as tmp:
-        path = Path(tmp) / "profiles.json"
-        path.write_text(json.dumps({
-            "p1": {"dietary_preference": "Jain", "allergens": ["Nuts"], "lifestyle": []}
-        }, indent=2))
-        with patch("core.profile_storage._PROFILES_PATH", path):
-            out = update_profile_partial("p1", lifestyle=["no alcohol"])
-        assert out is not None
-        assert out.dietary_preference == "Jain"
-        assert "Nuts" in out.allergens
-        assert "no alcohol" in (out.lifestyle or [])
+    monkeypatch.setattr("core.profile_storage._PROFILES_PATH", profiles_path)
+    out = update_profile_partial("p1", lifestyle=["no alcohol"])
+    assert out is not None
+    assert out.dietary_preference == "Jain"
+    assert "Nuts" in out.allergens
+    assert "no alcohol" in (out.lifestyle or [])
 
 
 def test_verdict_informational_ingredients():
     """ComplianceVerdict includes informational_ingredients (minor <2%)."""
-    from core.models.verdict import ComplianceVerdict, VerdictStatus
     v = ComplianceVerdict(
         status=VerdictStatus.SAFE,
         triggered_restrictions=[],
@@ -133,42 +179,30 @@ def test_verdict_informational_ingredients():
     assert d["informational_ingredients"] == ["salt", "yeast"]
 
 
-def test_profile_not_saved_on_ingredient_submission():
+def test_profile_not_saved_on_ingredient_submission(profiles_path, monkeypatch):
     """Chat with ingredients only must not call save_profile (profile persists; only /update or dialog save)."""
-    from unittest.mock import patch
-    from core.profile_storage import get_or_create_profile
-    from core.intent_detector import detect_intent
-    import app as app_module
-    save_calls = []
-
-    def track_save(profile):
-        save_calls.append(profile)
-
-    with patch("core.profile_storage.save_profile", side_effect=track_save):
-        with tempfile.TemporaryDirectory() as tmp:
-            path = Path(tmp) / "profiles.json"
-            path.write_text(json.dumps({
-                "test_u": {"user_id": "test_u", "dietary_preference": "Vegan", "allergens": [], "lifestyle": []}
-            }, indent=2))
-            with patch("core.profile_storage._PROFILES_PATH", path):
-                profile = get_or_create_profile("test_u")
-                field_name, values = app_module._parse_update_command("water, sugar")
-                assert field_name is None and values is None
-                parsed = detect_intent("water, sugar")
-                ingredients = parsed.ingredients
-                assert len(ingredients) >= 2
-                from core.bridge import run_new_engine_chat, user_profile_model_to_restriction_ids
-                restriction_ids = user_profile_model_to_restriction_ids(profile)
-                profile_context = {
-                    "dietary_preference": profile.dietary_preference,
-                    "allergens": profile.allergens,
-                    "lifestyle": profile.lifestyle,
-                }
-                run_new_engine_chat(
-                    ingredients,
-                    user_profile=profile,
-                    restriction_ids=restriction_ids,
-                    profile_context=profile_context,
-                    use_api_fallback=False,
-                )
-        assert len(save_calls) == 0, "save_profile must not be called when submitting ingredients only (no /update)"
+    save_calls = 0
+
+    def track_save(_profile):
+        nonlocal save_calls
+        save_calls += 1
+
+    monkeypatch.setattr("core.profile_storage.save_profile", track_save)
+    monkeypatch.setattr("core.profile_storage._PROFILES_PATH", profiles_path)
+
+    profile = get_or_create_profile("test_u")
+    field_name, values = app_module._parse_update_command("water, sugar")
+    assert field_name is None and values is None
+    parsed = detect_intent("water, sugar")
+    ingredients = parsed.ingredients
+    assert len(ingredients) >= 2
+    restriction_ids = user_profile_model_to_restriction_ids(profile)
+    profile_context = profile.to_context_dict()
+    run_new_engine_chat(
+        ingredients,
+        user_profile=profile,
+        restriction_ids=restriction_ids,
+        profile_context=profile_context,
+        use_api_fallback=False,
+    )
+    assert save_calls == 0, "save_profile must not be called when submitting ingredients only (no /update)"
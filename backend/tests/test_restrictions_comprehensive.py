@@ -3,10 +3,7 @@ Comprehensive restriction verification test suite.
 Covers all dietary, religious, lifestyle, and allergy restrictions
 with explicit expected outcomes for common ingredients.
 """
-import sys, os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-from dotenv import load_dotenv
-load_dotenv(os.path.join(os.path.dirname(__file__), "..", ".env"))
+import functools
 
 import pytest
 from core.evaluation.compliance_engine import ComplianceEngine
@@ -15,13 +12,16 @@ from core.models.verdict import VerdictStatus
 
 @pytest.fixture(scope="module")
 def engine():
-    return ComplianceEngine()
+    yield ComplianceEngine()
+    _eval.cache_clear()
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
+@functools.lru_cache(maxsize=None)
 def _eval(engine, ingredient, restriction):
+    """Offline single-ingredient status; pairs repeated across classes hit the cache."""
     v = engine.evaluate([ingredient], restriction_ids=[restriction], use_api_fallback=False)
     return v.status
 
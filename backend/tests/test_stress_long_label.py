@@ -13,6 +13,8 @@ from tests.fixtures.labels.stress_label import (
     run_user_input_stress,
 )
 
+pytestmark = pytest.mark.slow
+
 
 @pytest.fixture(scope="module")
 def stress_label() -> str:
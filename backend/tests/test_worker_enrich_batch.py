@@ -0,0 +1,95 @@
+"""Worker batches: concurrent enrichment lookups and a shared product resolver."""
+import threading
+from types import SimpleNamespace
+
+from core.external_apis.base import EnrichmentResult
+from core.knowledge import ontology_cache
+from core.knowledge.ontology_cache import OntologyBoundCache
+from worker import tasks
+
+
+class _Query:
+    def __init__(self, client):
+        self.client, self.update_payload = client, None
+
+    def select(self, *_a):
+        return self
+
+    def eq(self, col, val):
+        if self.update_payload is not None and col == "id":
+            self.client.updates.append((val, self.update_payload))
+        return self
+
+    def gte(self, *_a):
+        return self
+
+    def order(self, *_a, **_k):
+        return self
+
+    def limit(self, *_a):
+        return self
+
+    def update(self, payload):
+        self.update_payload = payload
+        return self
+
+    def execute(self):
+        return SimpleNamespace(data=self.client.rows)
+
+
+class _Client:
+    def __init__(self, rows):
+        self.rows, self.updates = rows, []
+
+    def table(self, _name):
+        return _Query(self)
+
+
+def test_lookups_overlap_and_updates_keep_order(monkeypatch):
+    rows = [{"id": i, "normalized_key": f"key_{i}"} for i in range(4)] + [{"id": 99, "normalized_key": ""}]
+    client = _Client(rows)
+    monkeypatch.setattr(tasks, "_get_db", lambda: SimpleNamespace(enabled=True, _client=client))
+
+    # Every lookup waits for all four to be in flight: only passes if they run concurrently.
+    barrier = threading.Barrier(4, timeout=5)
+
+    def _fetch(key, use_cache=True):
+        barrier.wait()
+        return EnrichmentResult(None, "low", "none", key)
+
+    monkeypatch.setattr(tasks, "fetch_ingredient_from_apis", _fetch)
+
+    out = tasks.enrich_unknown_batch.run(limit=10)
+
+    assert out == {"processed": 4}
+    assert [row_id for row_id, _ in client.updates] == [0, 1, 2, 3]
+    assert all(u["resolution_attempts"] == 1 for _, u in client.updates)
+
+
+def test_product_batches_share_one_resolver_until_ontology_changes(monkeypatch):
+    built = []
+
+    class _Resolver:
+        def __init__(self):
+            built.append(self)
+
+        def resolve_with_fallback(self, token, **_k):
+            return SimpleNamespace(ingredient=object() if token != "zzq" else None)
+
+    # canonicalizer cannot be the first module of its import cycle to load.
+    import core.evaluation.compliance_engine  # noqa: F401
+    from core.knowledge import canonicalizer
+
+    monkeypatch.setattr(canonicalizer, "CanonicalResolver", _Resolver)
+    monkeypatch.setattr(tasks, "_product_resolver", OntologyBoundCache(tasks._build_product_resolver))
+    stamp = [(1, 1)]
+    monkeypatch.setattr(ontology_cache, "ontology_stamp", lambda: stamp[0])
+
+    first = tasks.process_product_ingredients_batch.run(["salt, sugar", "zzq"])
+    tasks.process_product_ingredients_batch.run(["salt"])
+    assert len(built) == 1
+    assert first["resolved"] == 2 and first["enqueued"] == 1
+
+    stamp[0] = (1, 2)
+    tasks.process_product_ingredients_batch.run(["salt"])
+    assert len(built) == 2
@@ -13,6 +13,7 @@ on them yet. They only run when the Celery worker is started explicitly.
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, List
 
 from worker.celery_app import celery_app
@@ -20,15 +21,53 @@ from core.knowledge.ingredient_db import IngredientKnowledgeDB
 from core.external_apis.fetcher import fetch_ingredient_from_apis
 from core.external_apis.base import EnrichmentResult
 from core.knowledge.llm_classify import classify_ingredient_origin, apply_classification_to_ingredient
+from core.knowledge.ontology_cache import OntologyBoundCache
 
 
 logger = logging.getLogger(__name__)
 
+# External API lookups are network-bound, so a batch fetches them concurrently;
+# Supabase writes stay serial and in frequency order.
+_ENRICH_FETCH_WORKERS = 8
+
 
 def _get_db() -> IngredientKnowledgeDB:
     return IngredientKnowledgeDB()
 
 
+def _build_product_resolver():
+    from core.knowledge.canonicalizer import CanonicalResolver
+
+    return CanonicalResolver()
+
+
+# Product batches arrive back to back; building a CanonicalResolver loads the
+# whole ontology, so one instance (and its resolution cache) is shared across
+# batches until either ontology file changes on disk.
+_product_resolver = OntologyBoundCache(_build_product_resolver)
+
+
+def _get_product_resolver():
+    return _product_resolver.get()
+
+
+def _lookup_unknown(key: str) -> EnrichmentResult:
+    """External API lookup for one unknown key, plus LLM classification on medium confidence."""
+    result = fetch_ingredient_from_apis(key, use_cache=True)
+    # Optional LLM classification when APIs return medium confidence or inferred flags
+    if result.ingredient and result.confidence == "medium":
+        try:
+            classification = classify_ingredient_origin(key, description="", timeout=15)
+            if classification:
+                updated = apply_classification_to_ingredient(result.ingredient, classification)
+                result = EnrichmentResult(
+                    updated, result.confidence, result.source, result.raw_response_summary
+                )
+        except Exception as e:
+            logger.debug("enrich_unknown_batch: llm classify skip key=%s: %s", key[:40], e)
+    return result
+
+
 @celery_app.task(name="enrich_unknown_batch")
 def enrich_unknown_batch(min_frequency: int = 1, limit: int = 50) -> dict[str, Any]:
     """
@@ -63,23 +102,18 @@ def enrich_unknown_batch(min_frequency: int = 1, limit: int = 50) -> dict[str, A
     rows: List[dict[str, Any]] = resp.data or []
     logger.info("enrich_unknown_batch: loaded %d unknown ingredients (min_frequency=%d)", len(rows), min_frequency)
 
+    keyed = [(row, row.get("normalized_key") or "") for row in rows]
+    keyed = [(row, key) for row, key in keyed if key]
+    if keyed:
+        with ThreadPoolExecutor(
+            max_workers=min(_ENRICH_FETCH_WORKERS, len(keyed)), thread_name_prefix="enrich"
+        ) as pool:
+            results = list(pool.map(_lookup_unknown, [key for _, key in keyed]))
+    else:
+        results = []
+
     processed = 0
-    for row in rows:
-        key = row.get("normalized_key") or ""
-        if not key:
-            continue
-        result = fetch_ingredient_from_apis(key, use_cache=True)
-        # Optional LLM classification when APIs return medium confidence or inferred flags
-        if result.ingredient and result.confidence == "medium":
-            try:
-                classification = classify_ingredient_origin(key, description="", timeout=15)
-                if classification:
-                    updated = apply_classification_to_ingredient(result.ingredient, classification)
-                    result = EnrichmentResult(
-                        updated, result.confidence, result.source, result.raw_response_summary
-                    )
-            except Exception as e:
-                logger.debug("enrich_unknown_batch: llm classify skip key=%s: %s", key[:40], e)
+    for (row, key), result in zip(keyed, results):
         logger.info(
             "enrich_unknown_batch: lookup key=%s success=%s confidence=%s source=%s",
             key[:80], bool(result.ingredient), result.confidence, result.source,
@@ -136,11 +170,8 @@ def process_product_ingredients_batch(
     Call with a list of raw label strings (e.g. from OFF bulk). Unresolved tokens go to DB for discovery.
     """
     from core.normalization.parser import flatten_ingredients
-    from core.knowledge.canonicalizer import CanonicalResolver
-    from core.normalization.normalizer import normalize_ingredient_key
 
-    db = _get_db()
-    resolver = CanonicalResolver()
+    resolver = _get_product_resolver()
     resolved_count = 0
     enqueued_count = 0
     for raw in ingredient_strings: